@@ -3,11 +3,14 @@
 
 import timeit  # For measuring execution time
 from collections import deque  # For implementing BFS queue
+from search_stats import SearchStats  # For search instrumentation
+from sliding_puzzle import SlidingPuzzle  # Shared board logic
 
-class FivePuzzle:
+class FivePuzzle(SlidingPuzzle):
     """
     Class to represent and solve the 5-puzzle (2x3 grid) using BFS and IDS.
     The puzzle consists of tiles numbered 1–5 and a blank space (0).
+    Moves, packed states and table lookups come from SlidingPuzzle.
     """
 
     def __init__(self, start_state, goal_state):
@@ -18,143 +21,284 @@ class FivePuzzle:
             start_state: List of 6 integers representing the initial configuration
             goal_state: List of 6 integers representing the target configuration
         """
-        self.start_state = tuple(start_state)   # Immutable format
-        self.goal_state = tuple(goal_state)
-        self.rows = 2                           # Number of rows in puzzle
-        self.cols = 3                           # Number of columns in puzzle
-        self.actions = ['U', 'D', 'L', 'R']     # Possible moves: Up, Down, Left, Right
+        # 2x3 board, moves tried Up, Down, Left, Right
+        super().__init__(start_state, goal_state, rows=2, cols=3, actions=['U', 'D', 'L', 'R'])
 
-    def get_blank_position(self, state):
+    def bfs(self, packed=False, stats=None):
         """
-        Get the index of the blank tile (0) in the state.
-
-        Args:
-            state: Tuple representing puzzle state
-
-        Returns:
-            Integer index (0–5) of the blank tile
-        """
-        return state.index(0)
+        Solve the puzzle using Breadth-First Search (BFS).
 
-    def is_goal(self, state):
-        """
-        Check if the current state matches the goal state.
+        Each reached state keeps only a link to its parent and the action taken,
+        the move sequence is rebuilt once when the goal is dequeued.
 
         Args:
-            state: Tuple representing puzzle state
+            packed: If True, search over integer-packed states (see encode)
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats
 
         Returns:
-            True if goal is reached, False otherwise
-        """
-        return state == self.goal_state
-
-    def move(self, state, action):
+            List of actions to reach goal, or None if no solution exists
         """
-        Generate a new state by moving a tile into the blank space.
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        if not self.solvable:
+            return stats.finish(None)  # Goal is unreachable, skip the search
+
+        if packed:
+            start, goal = self.encode(self.start_state), self.encode(self.goal_state)
+            get_neighbors = self.get_packed_neighbors
+        else:
+            start, goal = self.start_state, self.goal_state
+            get_neighbors = self.get_neighbors
 
-        Actions describe where the tile comes from:
-        - 'U': Move tile from below into blank
-        - 'D': Move tile from above into blank
-        - 'L': Move tile from right into blank
-        - 'R': Move tile from left into blank
+        queue = deque()
+        queue.append(start)
+        parents = {start: None}  # state -> (parent_state, action)
 
-        Args:
-            state: Current puzzle state as tuple
-            action: Direction of the move ('U', 'D', 'L', 'R')
+        profiling = stats.profiling
+        expanded = generated = duplicates = 0
+        peak_frontier = 0
+        depth = 0
+        layer_left = 1  # States of the current depth still in the queue
+        path = None
 
-        Returns:
-            New state as a tuple or None if move is invalid
-        """
-        idx = self.get_blank_position(state)
-        row, col = divmod(idx, self.cols)
-        new_idx = None
-
-        # Determine index to swap with blank based on direction
-        if action == 'U' and row < self.rows - 1:
-            new_idx = idx + self.cols
-        elif action == 'D' and row > 0:
-            new_idx = idx - self.cols
-        elif action == 'L' and col < self.cols - 1:
-            new_idx = idx + 1
-        elif action == 'R' and col > 0:
-            new_idx = idx - 1
-
-        if new_idx is None:
-            return None  # Invalid move
-
-        # Perform the swap and return new state
-        state = list(state)
-        state[idx], state[new_idx] = state[new_idx], state[idx]
-        return tuple(state)
-
-    def get_neighbors(self, state):
+        while queue:
+            if len(queue) > peak_frontier:
+                peak_frontier = len(queue)
+            state = queue.popleft()
+            if state == goal:
+                path = self.reconstruct_path(parents, state)
+                break
+            expanded += 1
+            if profiling:
+                stats.record_expansion(state, depth)
+            for neighbor, action in get_neighbors(state):
+                generated += 1
+                if neighbor not in parents:
+                    parents[neighbor] = (state, action)
+                    queue.append(neighbor)
+                else:
+                    duplicates += 1
+            layer_left -= 1
+            if layer_left == 0:
+                # Everything left in the queue is one move deeper
+                depth += 1
+                layer_left = len(queue)
+
+        stats.nodes_expanded = expanded
+        stats.nodes_generated = generated
+        stats.duplicates = duplicates
+        stats.peak_frontier = peak_frontier
+        stats.peak_visited = len(parents)
+        return stats.finish(path)
+
+    def ids(self, packed=False, stats=None):
         """
-        Generate all valid neighboring states from the current state.
+        Solve the puzzle using Iterative Deepening Search (IDS).
 
         Args:
-            state: Tuple representing current puzzle state
-
-        Returns:
-            List of (new_state, action) pairs
-        """
-        neighbors = []
-        for action in self.actions:
-            new_state = self.move(state, action)
-            if new_state and new_state != state:
-                neighbors.append((new_state, action))
-        return neighbors
-
-    def bfs(self):
-        """
-        Solve the puzzle using Breadth-First Search (BFS).
+            packed: If True, search over integer-packed states (see encode)
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats. Counters add up
+                   over all deepening iterations.
 
         Returns:
             List of actions to reach goal, or None if no solution exists
         """
-        queue = deque()
-        queue.append((self.start_state, []))  # (state, path)
-        visited = set()
-        visited.add(self.start_state)
-
-        while queue:
-            state, path = queue.popleft()
-            if self.is_goal(state):
-                return path
-            for neighbor, action in self.get_neighbors(state):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [action]))
-        return None
-
-    def ids(self):
-        """
-        Solve the puzzle using Iterative Deepening Search (IDS).
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        if not self.solvable:
+            return stats.finish(None)  # Goal is unreachable, skip the search
+
+        if packed:
+            start, goal = self.encode(self.start_state), self.encode(self.goal_state)
+            get_neighbors = self.get_packed_neighbors
+        else:
+            start, goal = self.start_state, self.goal_state
+            get_neighbors = self.get_neighbors
+        profiling = stats.profiling
 
-        Returns:
-            List of actions to reach goal, or None if no solution exists
-        """
         def dls(state, path, depth, visited):
-            if self.is_goal(state):
+            if state == goal:
                 return path
             if depth == 0:
                 return None
-            for neighbor, action in self.get_neighbors(state):
+            stats.nodes_expanded += 1
+            if profiling:
+                stats.record_expansion(state, len(path))
+            for neighbor, action in get_neighbors(state):
+                stats.nodes_generated += 1
                 if neighbor not in visited:
                     visited.add(neighbor)
+                    # The path-local visited set is also the DFS stack
+                    if len(visited) > stats.peak_visited:
+                        stats.peak_visited = stats.peak_frontier = len(visited)
                     result = dls(neighbor, path + [action], depth - 1, visited)
                     if result is not None:
                         return result
                     visited.remove(neighbor)
+                else:
+                    stats.duplicates += 1
             return None
 
         depth = 0
         while True:
-            visited = set([self.start_state])
-            result = dls(self.start_state, [], depth, visited)
+            visited = set([start])
+            result = dls(start, [], depth, visited)
             if result is not None:
-                return result
+                return stats.finish(result)
             depth += 1
 
+    def transposition_ids(self, packed=False, stats=None):
+        """
+        Solve the puzzle using Iterative Deepening Search with a transposition table.
+
+        Each iteration runs a depth-limited search on an explicit stack of
+        neighbor iterators and keeps a single path that grows and shrinks
+        in place. A table maps every state seen in the iteration to the
+        largest remaining depth it was searched with; reaching it again
+        with no more depth left cannot find anything new and is pruned.
+        Every state is therefore expanded at most once per remaining depth
+        instead of once per path, and the goal is still found at the
+        shallowest depth.
+
+        Args:
+            packed: If True, search over integer-packed states (see encode)
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats. Counters add up
+                   over all deepening iterations.
+
+        Returns:
+            List of actions to reach goal, or None if no solution exists
+        """
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        if not self.solvable:
+            return stats.finish(None)  # Goal is unreachable, skip the search
+
+        if packed:
+            start, goal = self.encode(self.start_state), self.encode(self.goal_state)
+            get_neighbors = self.get_packed_neighbors
+        else:
+            start, goal = self.start_state, self.goal_state
+            get_neighbors = self.get_neighbors
+        if start == goal:
+            return stats.finish([])
+        profiling = stats.profiling
+
+        limit = 0
+        while True:
+            limit += 1
+            table = {start: limit}                 # state -> best remaining depth seen
+            path = []                              # Actions from the start to the top of the stack
+            states = [start]                       # States along the path, for the histogram and hook
+            stack = [iter(get_neighbors(start))]   # Neighbors still to try, one iterator per depth
+            stats.nodes_expanded += 1
+            if profiling:
+                stats.record_expansion(start, 0)
+
+            while stack:
+                for neighbor, action in stack[-1]:
+                    stats.nodes_generated += 1
+                    remaining = limit - len(stack)
+                    if table.get(neighbor, -1) >= remaining:
+                        stats.duplicates += 1      # Already searched at least this deep
+                        continue
+                    table[neighbor] = remaining
+                    path.append(action)
+                    if neighbor == goal:
+                        stats.peak_visited = max(stats.peak_visited, len(table))
+                        return stats.finish(path)
+                    if remaining > 0:
+                        # Descend into the neighbor
+                        stats.nodes_expanded += 1
+                        if profiling:
+                            stats.record_expansion(neighbor, len(path))
+                        states.append(neighbor)
+                        stack.append(iter(get_neighbors(neighbor)))
+                        stats.peak_frontier = max(stats.peak_frontier, len(stack))
+                        break
+                    path.pop()                     # Depth limit reached
+                else:
+                    # All neighbors tried, backtrack one level
+                    stack.pop()
+                    states.pop()
+                    if stack:
+                        path.pop()
+
+            stats.peak_visited = max(stats.peak_visited, len(table))
+
+    def bidirectional_bfs(self, stats=None):
+        """
+        Solve the puzzle using bidirectional Breadth-First Search.
+
+        Searches forward from the start state and backward from the goal state
+        at the same time, always expanding one full layer of the smaller
+        frontier. The first state reached by both searches lies on a shortest
+        path, because complete layers are expanded. Actions recorded on the
+        goal side are inverted and reversed when the two halves are joined.
+
+        Args:
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats
+
+        Returns:
+            List of actions to reach goal, or None if no solution exists
+        """
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        if not self.solvable:
+            return stats.finish(None)  # Goal is unreachable, skip the search
+        if self.start_state == self.goal_state:
+            return stats.finish([])
+
+        forward_parents = {self.start_state: None}  # state -> (parent_state, action)
+        backward_parents = {self.goal_state: None}
+        forward_frontier = [self.start_state]
+        backward_frontier = [self.goal_state]
+        forward_depth = backward_depth = 0
+        profiling = stats.profiling
+
+        while forward_frontier and backward_frontier:
+            # Grow the smaller side by one layer
+            forward = len(forward_frontier) <= len(backward_frontier)
+            if forward:
+                frontier, parents, others = forward_frontier, forward_parents, backward_parents
+                depth = forward_depth
+            else:
+                frontier, parents, others = backward_frontier, backward_parents, forward_parents
+                depth = backward_depth
+            stats.peak_frontier = max(stats.peak_frontier, len(forward_frontier) + len(backward_frontier))
+
+            next_frontier = []
+            for state in frontier:
+                stats.nodes_expanded += 1
+                if profiling:
+                    stats.record_expansion(state, depth)
+                for neighbor, action in self.get_neighbors(state):
+                    stats.nodes_generated += 1
+                    if neighbor in parents:
+                        stats.duplicates += 1
+                        continue
+                    parents[neighbor] = (state, action)
+                    if neighbor in others:
+                        stats.peak_visited = len(forward_parents) + len(backward_parents)
+                        return stats.finish(self.join_paths(forward_parents, backward_parents, neighbor))
+                    next_frontier.append(neighbor)
+
+            if forward:
+                forward_frontier = next_frontier
+                forward_depth += 1
+            else:
+                backward_frontier = next_frontier
+                backward_depth += 1
+        stats.peak_visited = len(forward_parents) + len(backward_parents)
+        return stats.finish(None)
+
 def get_valid_state(prompt):
     """
     Prompt user to input a valid 5-puzzle state.
@@ -205,6 +349,10 @@ def main():
     3. Change start state
     4. Change goal state
     5. Exit program
+    6. Solve using bidirectional BFS
+    7. Solve using the precomputed distance table
+    8. Solve using IDS with a transposition table
+    9. Solve using the vectorized layer-synchronous BFS (needs NumPy)
     """
     # Get initial start and goal states from user
     start_state = get_valid_state("Enter the 5-puzzle start state: ")
@@ -213,7 +361,8 @@ def main():
 
     # Interactive menu loop
     while True:
-        print("Make selection: [1]: BFS, [2]: IDS, [3]: New start state, [4]: New goal state, [5] Exit")
+        print("Make selection: [1]: BFS, [2]: IDS, [3]: New start state, [4]: New goal state, [5] Exit, "
+              "[6]: Bi-BFS, [7]: Table, [8]: IDS-TT, [9]: Vector BFS")
         choice = input()
         if choice == '1':
             # Solve using Breadth-First Search
@@ -223,6 +372,7 @@ def main():
             print(f"Sequence of moves (BFS): {' '.join(moves) if moves else 'No solution'}")
             print(f"No. of steps (BFS): {len(moves) if moves else 0}")
             print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
         elif choice == '2':
             # Solve using Iterative Deepening Search
             start_time = timeit.default_timer()
@@ -231,17 +381,53 @@ def main():
             print(f"Sequence of moves (IDS): {' '.join(moves) if moves else 'No solution'}")
             print(f"No. of steps (IDS): {len(moves) if moves else 0}")
             print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
         elif choice == '3':
             # Change start state
             start_state = get_valid_state("Enter the 5-puzzle start state: ")
-            puzzle.start_state = tuple(start_state)
+            puzzle.set_start_state(start_state)
         elif choice == '4':
             # Change goal state
             goal_state = get_valid_state("Enter the 5-puzzle goal state: ")
-            puzzle.goal_state = tuple(goal_state)
+            puzzle.set_goal_state(goal_state)
         elif choice == '5':
             # Exit program
             break
+        elif choice == '6':
+            # Solve using bidirectional Breadth-First Search
+            start_time = timeit.default_timer()
+            moves = puzzle.bidirectional_bfs()
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (Bi-BFS): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of steps (Bi-BFS): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+        elif choice == '7':
+            # Solve using the distance table of the goal state
+            start_time = timeit.default_timer()
+            moves = puzzle.table_solve()
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (Table): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of steps (Table): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+        elif choice == '8':
+            # Solve using Iterative Deepening Search with a transposition table
+            start_time = timeit.default_timer()
+            moves = puzzle.transposition_ids()
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (IDS-TT): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of steps (IDS-TT): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+        elif choice == '9':
+            # Solve using the layer-synchronous BFS over NumPy arrays
+            start_time = timeit.default_timer()
+            moves = puzzle.vector_bfs()
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (Vector BFS): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of steps (Vector BFS): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
         else:
             print("Invalid selection.")
 
@@ -2,11 +2,14 @@
 # Sava Josè Maria 
 import timeit  # For measuring execution time
 import heapq   # For priority queue implementation in A* algorithm
+from search_stats import SearchStats  # For search instrumentation
+from sliding_puzzle import SlidingPuzzle, max_heuristic  # Shared board logic, heuristics and IDA*
 
-class EightPuzzle:
+class EightPuzzle(SlidingPuzzle):
     """
     Class to represent and solve the 8-puzzle using A* search algorithm.
     The puzzle is a 3x3 grid with tiles numbered 1-8 and one blank space (0).
+    Moves, heuristics, IDA* and table lookups come from SlidingPuzzle.
     """
     
     def __init__(self, start_state, goal_state):
@@ -17,11 +20,8 @@ class EightPuzzle:
             start_state: List of 9 integers representing initial puzzle configuration
             goal_state: List of 9 integers representing target puzzle configuration
         """
-        self.start_state = tuple(start_state)  # Convert to tuple for immutability
-        self.goal_state = tuple(goal_state)    # Convert to tuple for immutability
-        self.rows = 3                          # Number of rows in the puzzle
-        self.cols = 3                          # Number of columns in the puzzle
-        self.actions = ['L', 'R', 'U', 'D']    # Possible moves: Left, Right, Up, Down
+        # 3x3 board, moves tried Left, Right, Up, Down
+        super().__init__(start_state, goal_state, rows=3, cols=3, actions=['L', 'R', 'U', 'D'])
 
     def get_blank_pos(self, state):
         """
@@ -33,167 +33,485 @@ class EightPuzzle:
         Returns:
             Integer index (0-8) where the blank tile is located
         """
-        return state.index(0)
+        return self.get_blank_position(state)
 
-    def is_goal(self, state):
+    def search_setup(self, heuristic_func, packed, stats):
         """
-        Check if the current state matches the goal state.
+        Prepare the state representation and heuristic shared by the A* searches.
         
         Args:
-            state: Tuple representing current puzzle configuration
+            heuristic_func: Function to calculate heuristic value (h(n))
+            packed: If True, search over integer-packed states (see encode)
+            stats: SearchStats of the search, for timing the first heuristic call
             
         Returns:
-            Boolean: True if state equals goal state, False otherwise
+            Tuple (start, goal, get_neighbors, heuristic, moved_tile, h_table,
+            initial_h, heuristic_time). moved_tile(state, neighbor) gives the
+            tile that slid into the blank with its new and old cell; h_table is
+            the per-tile table of a built-in heuristic (None otherwise), used to
+            update h from the parent's h instead of recomputing it.
         """
-        return state == self.goal_state
+        size = self.rows * self.cols
+        if packed:
+            start, goal = self.encode(self.start_state), self.encode(self.goal_state)
+            get_neighbors = self.get_packed_neighbors
+            heuristic = lambda code: heuristic_func(self.decode(code))
+
+            bits, mask = self.cell_bits, self.cell_mask
+
+            def moved_tile(state, neighbor):
+                blank = state & mask
+                return (neighbor >> (bits * (size - blank))) & mask, neighbor & mask, blank
+        else:
+            start, goal = self.start_state, self.goal_state
+            get_neighbors = self.get_neighbors
+            heuristic = heuristic_func
 
-    def move(self, state, action):
+            def moved_tile(state, neighbor):
+                blank = state.index(0)
+                return neighbor[blank], neighbor.index(0), blank
+
+        # Built-in heuristics are updated from the parent's h instead of recomputed
+        h_table = self.get_heuristic_table(heuristic_func)
+
+        heuristic_time = 0.0
+        if stats.time_heuristic:
+            started = timeit.default_timer()
+        initial_h = heuristic(start)
+        if stats.time_heuristic:
+            heuristic_time += timeit.default_timer() - started
+        return start, goal, get_neighbors, heuristic, moved_tile, h_table, initial_h, heuristic_time
+
+    def record_search_stats(self, stats, path, expanded, generated, duplicates, peak_frontier,
+                            peak_visited, heuristic_time):
         """
-        Generate a new state by moving a tile into the blank space.
-        
-        The action represents moving a tile INTO the blank space:
-        - 'L': Move tile from right side into blank (blank effectively moves right)
-        - 'R': Move tile from left side into blank (blank effectively moves left)
-        - 'U': Move tile from below into blank (blank effectively moves down)
-        - 'D': Move tile from above into blank (blank effectively moves up)
+        Store the counters of a finished A* search and stop its clock.
         
         Args:
-            state: Current puzzle state as tuple
-            action: String representing move direction ('L', 'R', 'U', 'D')
+            stats: SearchStats of the search
+            path: List of actions found, or None
+            expanded, generated, duplicates: Node counters of the search
+            peak_frontier: Largest size of the open list
+            peak_visited: Number of states remembered as seen
+            heuristic_time: Seconds spent computing h
             
         Returns:
-            New state as tuple after move, or None if move is invalid
+            The path, so searches can end with return self.record_search_stats(...)
         """
-        idx = self.get_blank_pos(state)           # Get current blank position
-        row, col = divmod(idx, self.cols)         # Convert index to row, column coordinates
-        new_idx = None                            # Initialize target position
-
-        # Determine the position of tile to move into blank space
-        if action == 'L' and col < self.cols - 1:  # Move tile from right into blank
-            new_idx = idx + 1
-        elif action == 'R' and col > 0:           # Move tile from left into blank
-            new_idx = idx - 1
-        elif action == 'U' and row < self.rows - 1:  # Move tile from below into blank
-            new_idx = idx + self.cols
-        elif action == 'D' and row > 0:           # Move tile from above into blank
-            new_idx = idx - self.cols
-
-        # Return None if move is invalid (out of bounds)
-        if new_idx is None:
-            return None
-
-        # Create new state by swapping blank with target tile
-        state = list(state)                       # Convert to list for modification
-        state[idx], state[new_idx] = state[new_idx], state[idx]  # Swap positions
-        return tuple(state)                       # Return as immutable tuple
-
-    def get_neighbors(self, state):
+        stats.nodes_expanded = expanded
+        stats.nodes_generated = generated
+        stats.duplicates = duplicates
+        stats.peak_frontier = peak_frontier
+        stats.peak_visited = peak_visited
+        stats.heuristic_time = heuristic_time
+        return stats.finish(path)                 # None if no solution found
+
+    def a_star(self, heuristic_func, packed=False, stats=None, open_list='bucket'):
         """
-        Generate all valid neighboring states from the current state.
+        Implement A* search algorithm to find optimal solution.
+        
+        A* uses f(n) = g(n) + h(n) where:
+        - g(n) = actual cost from start to current node
+        - h(n) = heuristic estimate from current node to goal
+        - f(n) = estimated total cost of path through current node
+        
+        Open list entries only carry the state; the path is rebuilt from
+        parent links once the goal is popped.
+        
+        Costs are small integers, so by default the open list is a bucket
+        queue: buckets[f][g] is a LIFO stack of states, popped from the
+        lowest f and, among equal f, the highest g (the state that is
+        deepest and closest to the goal). Pushes and pops take constant
+        time and no entry tuples are built. Every state keeps its best known
+        g; entries left behind by an improved g are skipped when popped.
+        The heapq open list of (f, g, state) entries is kept as a fallback,
+        with the same best-g bookkeeping and stale-entry skipping. Buckets
+        need integer costs, so a heuristic whose value for the start state
+        is not an int (e.g. a scaled estimate) is always searched with the
+        heap; such a heuristic must not return ints for some states only.
         
         Args:
-            state: Current puzzle state as tuple
+            heuristic_func: Function to calculate heuristic value (h(n))
+            packed: If True, search over integer-packed states (see encode)
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats
+            open_list: 'bucket' for the bucket queue (integer heuristics only,
+                       others fall back to the heap) or 'heap' for heapq
             
         Returns:
-            List of tuples: Each tuple contains (new_state, action_taken)
+            List of actions leading to goal, or None if no solution exists
+            
+        Raises:
+            ValueError: If open_list is not 'bucket' or 'heap'
         """
-        neighbors = []
-        # Try each possible action
-        for action in self.actions:
-            new_state = self.move(state, action)
-            # Only add valid moves that result in different states
-            if new_state and new_state != state:
-                neighbors.append((new_state, action))
-        return neighbors
-
-    def manhattan_distance(self, state):
+        if open_list not in ('bucket', 'heap'):
+            raise ValueError(f"Unknown open list {open_list!r}, expected 'bucket' or 'heap'")
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        if not self.solvable:
+            return stats.finish(None)             # Goal is unreachable, skip the search
+
+        (start, goal, get_neighbors, heuristic, moved_tile, h_table,
+         initial_h, heuristic_time) = self.search_setup(heuristic_func, packed, stats)
+
+        profiling = stats.profiling
+        timing = stats.time_heuristic             # Measure time spent computing h
+        clock = timeit.default_timer
+        expanded = generated = duplicates = 0
+        peak_frontier = 1
+        path = None
+
+        if open_list == 'bucket' and isinstance(initial_h, int):
+            buckets = [[] for _ in range(initial_h)]  # buckets[f][g]: stack of states
+            buckets.append([[start]])
+            f = initial_h                         # Lowest f that may hold states
+            open_count = 1
+            g_scores = {start: 0}                 # Best known g of every generated state
+            parents = {start: None}               # state -> (parent_state, action)
+
+            while open_count:
+                # Find the highest g stack with states in the lowest f bucket
+                stacks = buckets[f]
+                g = len(stacks) - 1
+                while g >= 0 and not stacks[g]:
+                    g -= 1
+                del stacks[g + 1:]                # Drop the empty stacks above g
+                if g < 0:
+                    f += 1                        # Bucket exhausted
+                    continue
+                state = stacks[g].pop()
+                open_count -= 1
+                if g_scores[state] < g:
+                    continue                      # Stale entry, state was reached more cheaply
+
+                if state == goal:
+                    path = self.reconstruct_path(parents, state)
+                    break
+                expanded += 1
+                if profiling:
+                    stats.record_expansion(state, g)
+
+                new_g = g + 1                     # Cost increases by 1 for each move
+                for neighbor, action in get_neighbors(state):
+                    generated += 1
+                    if new_g < g_scores.get(neighbor, new_g + 1):
+                        g_scores[neighbor] = new_g
+                        parents[neighbor] = (state, action)
+                        if timing:
+                            started = clock()
+                        if h_table is not None:
+                            # Only the tile that slid into the blank changed position
+                            tile, old_idx, new_idx = moved_tile(state, neighbor)
+                            h = f - g + h_table[tile][new_idx] - h_table[tile][old_idx]
+                        else:
+                            h = heuristic(neighbor)   # Heuristic estimate to goal
+                        if timing:
+                            heuristic_time += clock() - started
+                        new_f = new_g + h         # Total estimated cost
+                        while len(buckets) <= new_f:
+                            buckets.append([])
+                        new_stacks = buckets[new_f]
+                        while len(new_stacks) <= new_g:
+                            new_stacks.append([])
+                        new_stacks[new_g].append(neighbor)
+                        open_count += 1
+                        if new_f < f:
+                            f = new_f             # Only with inconsistent heuristics
+                    else:
+                        duplicates += 1
+                if open_count > peak_frontier:
+                    peak_frontier = open_count
+
+            return self.record_search_stats(stats, path, expanded, generated, duplicates,
+                                            peak_frontier, len(g_scores), heuristic_time)
+
+        # Priority queue: (f_score, g_score, state)
+        heap = []
+        heapq.heappush(heap, (initial_h, 0, start))
+        g_scores = {start: 0}                    # Best known g of every generated state
+        parents = {start: None}                  # state -> (parent_state, action)
+
+        while heap:
+            # Get state with lowest f-score
+            f, g, state = heapq.heappop(heap)
+            if g_scores[state] < g:
+                continue                         # Stale entry, state was reached more cheaply
+            
+            # Check if we've reached the goal
+            if state == goal:
+                path = self.reconstruct_path(parents, state)
+                break
+            expanded += 1
+            if profiling:
+                stats.record_expansion(state, g)
+            
+            # Explore all neighbors
+            new_g = g + 1                        # Cost increases by 1 for each move
+            for neighbor, action in get_neighbors(state):
+                generated += 1
+                if new_g < g_scores.get(neighbor, new_g + 1):
+                    g_scores[neighbor] = new_g
+                    parents[neighbor] = (state, action)
+                    if timing:
+                        started = clock()
+                    if h_table is not None:
+                        # Only the tile that slid into the blank changed position
+                        tile, old_idx, new_idx = moved_tile(state, neighbor)
+                        h = f - g + h_table[tile][new_idx] - h_table[tile][old_idx]
+                    else:
+                        h = heuristic(neighbor)          # Heuristic estimate to goal
+                    if timing:
+                        heuristic_time += clock() - started
+                    new_f = new_g + h                    # Total estimated cost
+                    # Add to priority queue
+                    heapq.heappush(heap, (new_f, new_g, neighbor))
+                else:
+                    duplicates += 1
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+        
+        return self.record_search_stats(stats, path, expanded, generated, duplicates,
+                                        peak_frontier, len(g_scores), heuristic_time)
+
+    def weighted_a_star(self, heuristic_func, weight=2.0, packed=False, stats=None):
         """
-        Calculate Manhattan Distance heuristic for A* search.
+        Implement weighted A* to find a bounded-suboptimal solution quickly.
         
-        Manhattan distance is the sum of horizontal and vertical distances
-        each tile needs to move to reach its goal position. This is an
-        admissible heuristic (never overestimates the actual cost).
+        States are ordered by f(n) = g(n) + weight * h(n), which trusts the
+        heuristic more and dives towards the goal, expanding far fewer
+        states than A*. With an admissible heuristic the solution is at most
+        weight times longer than optimal; the bound actually proven by the
+        search (often tighter) is stored in self.stats.suboptimality_bound.
         
         Args:
-            state: Current puzzle state as tuple
+            heuristic_func: Function to calculate heuristic value (h(n))
+            weight: Heuristic weight w >= 1 (1 gives plain A*)
+            packed: If True, search over integer-packed states (see encode)
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats
             
         Returns:
-            Integer: Sum of Manhattan distances for all tiles
+            List of actions leading to goal, or None if no solution exists
+            
+        Raises:
+            ValueError: If weight is smaller than 1
         """
-        distance = 0
-        for i, tile in enumerate(state):
-            if tile == 0:  # Skip the blank tile
-                continue
-            # Find where this tile should be in goal state
-            goal_idx = self.goal_state.index(tile)
-            # Convert current and goal positions to row,col coordinates
-            row1, col1 = divmod(i, self.cols)         # Current position
-            row2, col2 = divmod(goal_idx, self.cols)  # Goal position
-            # Add Manhattan distance for this tile
-            distance += abs(row1 - row2) + abs(col1 - col2)
-        return distance
-
-    def out_of_place(self, state):
+        return self.anytime_a_star(heuristic_func, weight, packed=packed, stats=stats,
+                                   first_solution=True)
+
+    def anytime_a_star(self, heuristic_func, weight=2.0, timeout=None, max_nodes=None,
+                       packed=False, stats=None, first_solution=False):
         """
-        Calculate Out-of-Place heuristic for A* search.
+        Implement anytime weighted A* within a time or node budget.
+        
+        The search runs weighted A* (f(n) = g(n) + weight * h(n)) and keeps
+        going after the first solution: every cheaper path to the goal
+        replaces the current one, states that cannot beat it
+        (g(n) + h(n) >= its cost) are pruned, and states reached again with
+        a smaller g are reopened. It stops when the open list is empty,
+        which proves the last solution optimal, or when the budget runs out.
         
-        Counts the number of tiles that are not in their correct positions.
-        This is also an admissible heuristic but generally less informed
-        than Manhattan distance.
+        The suboptimality bound of the returned solution is its cost divided
+        by the smallest g(n) + h(n) left on the open list, a lower bound on
+        the optimal cost for an admissible heuristic. It is stored in
+        self.stats.suboptimality_bound (1.0 once optimality is proven).
         
         Args:
-            state: Current puzzle state as tuple
+            heuristic_func: Function to calculate heuristic value (h(n))
+            weight: Heuristic weight w >= 1 of the ordering
+            timeout: Optional wall time budget in seconds
+            max_nodes: Optional budget of expanded states
+            packed: If True, search over integer-packed states (see encode)
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats
+            first_solution: If True, stop at the first solution (weighted A*)
             
         Returns:
-            Integer: Number of tiles in wrong positions (excluding blank)
+            List of actions leading to goal, or None if no solution exists or
+            none was found within the budget
+            
+        Raises:
+            ValueError: If weight is smaller than 1
         """
-        return sum(1 for i in range(len(state)) 
-                  if state[i] != 0 and state[i] != self.goal_state[i])
+        if weight < 1:
+            raise ValueError(f"Heuristic weight must be at least 1, got {weight}")
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        if not self.solvable:
+            return stats.finish(None)             # Goal is unreachable, skip the search
 
-    def a_star(self, heuristic_func):
+        (start, goal, get_neighbors, heuristic, moved_tile, h_table,
+         initial_h, heuristic_time) = self.search_setup(heuristic_func, packed, stats)
+
+        profiling = stats.profiling
+        timing = stats.time_heuristic             # Measure time spent computing h
+        clock = timeit.default_timer
+        deadline = clock() + timeout if timeout is not None else None
+        expanded = generated = duplicates = 0
+        peak_frontier = 1
+        path = None
+        best_cost = float('inf')                  # Cost of the best solution so far
+
+        # Priority queue: (weighted f, h, g, state), ties go to the state closest to the goal
+        heap = [(weight * initial_h, initial_h, 0, start)]
+        g_scores = {start: 0}                     # Best known g of every generated state
+        parents = {start: None}                   # state -> (parent_state, action)
+
+        while heap:
+            if max_nodes is not None and expanded >= max_nodes:
+                break                             # Node budget exhausted
+            if deadline is not None and expanded % 256 == 0 and clock() >= deadline:
+                break                             # Time budget exhausted
+
+            _, h, g, state = heapq.heappop(heap)
+            if g > g_scores[state] or g + h >= best_cost:
+                continue                          # Stale entry, or cannot beat the current solution
+
+            if state == goal:
+                best_cost = g
+                path = self.reconstruct_path(parents, state)
+                if first_solution:
+                    break
+                continue
+            expanded += 1
+            if profiling:
+                stats.record_expansion(state, g)
+
+            new_g = g + 1                         # Cost increases by 1 for each move
+            for neighbor, action in get_neighbors(state):
+                generated += 1
+                if new_g < g_scores.get(neighbor, new_g + 1):
+                    if timing:
+                        started = clock()
+                    if h_table is not None:
+                        # Only the tile that slid into the blank changed position
+                        tile, old_idx, new_idx = moved_tile(state, neighbor)
+                        new_h = h + h_table[tile][new_idx] - h_table[tile][old_idx]
+                    else:
+                        new_h = heuristic(neighbor)   # Heuristic estimate to goal
+                    if timing:
+                        heuristic_time += clock() - started
+                    # States are reopened when reached more cheaply
+                    g_scores[neighbor] = new_g
+                    parents[neighbor] = (state, action)
+                    if new_g + new_h < best_cost:
+                        heapq.heappush(heap, (new_g + weight * new_h, new_h, new_g, neighbor))
+                else:
+                    duplicates += 1
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+
+        if path is not None:
+            # Smallest admissible f still open bounds the optimal cost from below
+            lower = best_cost
+            for _, h, g, state in heap:
+                if g == g_scores[state] and g + h < lower:
+                    lower = g + h
+            stats.suboptimality_bound = best_cost / lower if lower > 0 else 1.0
+
+        return self.record_search_stats(stats, path, expanded, generated, duplicates,
+                                        peak_frontier, len(g_scores), heuristic_time)
+
+    def bidirectional_a_star(self, heuristic_func, backward_heuristic_func=None, stats=None):
         """
-        Implement A* search algorithm to find optimal solution.
+        Implement bidirectional A* search to find an optimal solution.
         
-        A* uses f(n) = g(n) + h(n) where:
-        - g(n) = actual cost from start to current node
-        - h(n) = heuristic estimate from current node to goal
-        - f(n) = estimated total cost of path through current node
+        One A* search runs forward from the start state towards the goal and
+        another runs backward from the goal state towards the start, always
+        advancing the side with the smaller open list. Every state generated
+        by both sides gives a candidate path; the best one is returned once
+        its cost is no larger than the smallest f on one of the open lists,
+        which with consistent heuristics proves it optimal.
         
         Args:
-            heuristic_func: Function to calculate heuristic value (h(n))
+            heuristic_func: Heuristic method of this puzzle (h(n) towards the goal)
+            backward_heuristic_func: Heuristic towards the start state for the
+                                     backward search; by default the same
+                                     method bound to the reversed puzzle
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats
             
         Returns:
             List of actions leading to goal, or None if no solution exists
+            
+        Raises:
+            ValueError: If backward_heuristic_func is omitted and heuristic_func
+                        is not a method of this puzzle
         """
-        # Priority queue: (f_score, g_score, state, path_to_state)
-        heap = []
-        initial_h = heuristic_func(self.start_state)
-        heapq.heappush(heap, (initial_h, 0, self.start_state, []))
-        
-        # Set to keep track of visited states (avoid cycles)
-        visited = set()
-        visited.add(self.start_state)
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        if not self.solvable:
+            return stats.finish(None)             # Goal is unreachable, skip the search
+
+        if backward_heuristic_func is None:
+            if getattr(heuristic_func, '__self__', None) is not self:
+                raise ValueError("No backward heuristic can be derived from "
+                                 f"{getattr(heuristic_func, '__name__', heuristic_func)!r}, "
+                                 "pass backward_heuristic_func")
+            # Same heuristic method, bound to the puzzle with start and goal swapped
+            reverse = type(self)(self.goal_state, self.start_state)
+            backward_heuristic_func = heuristic_func.__func__.__get__(reverse)
+
+        # Per direction: open list of (f, g, state), best g, parent links, expanded states
+        forward = ([(heuristic_func(self.start_state), 0, self.start_state)],
+                   {self.start_state: 0}, {self.start_state: None}, set(), heuristic_func)
+        backward = ([(backward_heuristic_func(self.goal_state), 0, self.goal_state)],
+                    {self.goal_state: 0}, {self.goal_state: None}, set(), backward_heuristic_func)
+
+        best_cost = 0 if self.start_state == self.goal_state else float('inf')
+        meeting_state = self.start_state
+        profiling = stats.profiling
+        timing = stats.time_heuristic             # Measure time spent computing h
+        clock = timeit.default_timer
+
+        while forward[0] and backward[0]:
+            # Stop once no open state can lead to a cheaper path
+            if best_cost <= max(forward[0][0][0], backward[0][0][0]):
+                break
+
+            stats.peak_frontier = max(stats.peak_frontier, len(forward[0]) + len(backward[0]))
+            # Advance the side with fewer open states
+            if len(forward[0]) <= len(backward[0]):
+                (heap, g_scores, parents, closed, heuristic), other_g = forward, backward[1]
+            else:
+                (heap, g_scores, parents, closed, heuristic), other_g = backward, forward[1]
+
+            _, g, state = heapq.heappop(heap)
+            if state in closed or g > g_scores[state]:
+                continue                          # Stale entry for an improved state
+            closed.add(state)
+            stats.nodes_expanded += 1
+            if profiling:
+                stats.record_expansion(state, g)
 
-        while heap:
-            # Get state with lowest f-score
-            f, g, state, path = heapq.heappop(heap)
-            
-            # Check if we've reached the goal
-            if self.is_goal(state):
-                return path
-            
-            # Explore all neighbors
             for neighbor, action in self.get_neighbors(state):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    # Calculate costs for neighbor
-                    new_g = g + 1                        # Cost increases by 1 for each move
-                    h = heuristic_func(neighbor)         # Heuristic estimate to goal
-                    new_f = new_g + h                    # Total estimated cost
-                    # Add to priority queue
-                    heapq.heappush(heap, (new_f, new_g, neighbor, path + [action]))
-        
-        return None  # No solution found
+                stats.nodes_generated += 1
+                new_g = g + 1
+                if new_g < g_scores.get(neighbor, float('inf')):
+                    g_scores[neighbor] = new_g
+                    parents[neighbor] = (state, action)
+                    if timing:
+                        started = clock()
+                    h = heuristic(neighbor)
+                    if timing:
+                        stats.heuristic_time += clock() - started
+                    heapq.heappush(heap, (new_g + h, new_g, neighbor))
+                else:
+                    stats.duplicates += 1
+                # A state known to both sides joins two partial paths
+                if neighbor in other_g:
+                    cost = g_scores[neighbor] + other_g[neighbor]
+                    if cost < best_cost:
+                        best_cost = cost
+                        meeting_state = neighbor
+
+        stats.peak_visited = len(forward[1]) + len(backward[1])
+        if best_cost == float('inf'):
+            return stats.finish(None)             # The two searches never met
+        return stats.finish(self.join_paths(forward[2], backward[2], meeting_state))
 
 def get_valid_eight_puzzle_state(prompt):
     """
@@ -247,6 +565,17 @@ def main():
     3. Change start state
     4. Change goal state
     5. Exit program
+    6. Solve using IDA* with Manhattan Distance heuristic
+    7. Solve using IDA* with Out-of-Place heuristic
+    8. Solve using bidirectional A* with Manhattan Distance heuristic
+    9. Solve using bidirectional A* with Out-of-Place heuristic
+    10. Solve using the precomputed distance table
+    11. Solve using additive pattern databases
+    12. Solve using Manhattan Distance plus linear conflicts
+    13. Solve using the max of pattern databases and linear conflicts
+    14. Solve using IDA* with the max of pattern databases and linear conflicts
+    15. Solve using weighted A* (w = 2) with Manhattan Distance heuristic
+    16. Solve using anytime A* with Manhattan Distance heuristic within 0.1 seconds
     """
     # Get initial puzzle states from user with validation
     start_state = get_valid_eight_puzzle_state("Enter the 8-puzzle start state: ")
@@ -257,7 +586,10 @@ def main():
 
     # Main program loop
     while True:
-        print("Make selection: [1]: MD, [2]: OOPT, [3]: New start state, [4]: New goal state, [5] Exit")
+        print("Make selection: [1]: MD, [2]: OOPT, [3]: New start state, [4]: New goal state, [5] Exit, "
+              "[6]: IDA* MD, [7]: IDA* OOPT, [8]: Bi-A* MD, [9]: Bi-A* OOPT, "
+              "[10]: Table, [11]: PDB, [12]: LC, [13]: Max, [14]: IDA* Max, [15]: WA* MD, "
+              "[16]: Anytime MD")
         choice = input()
         
         if choice == '1':
@@ -268,6 +600,7 @@ def main():
             print(f"Sequence of moves (MD): {' '.join(moves) if moves else 'No solution'}")
             print(f"No. of moves (MD): {len(moves) if moves else 0}")
             print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
             
         elif choice == '2':
             # Solve using Out-of-Place heuristic
@@ -277,21 +610,131 @@ def main():
             print(f"Sequence of moves (OOPT): {' '.join(moves) if moves else 'No solution'}")
             print(f"No. of moves (OOPT): {len(moves) if moves else 0}")
             print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
             
         elif choice == '3':
             # Allow user to input new start state
             start_state = get_valid_eight_puzzle_state("Enter the 8-puzzle start state: ")
-            puzzle.start_state = tuple(start_state)
+            puzzle.set_start_state(start_state)
             
         elif choice == '4':
             # Allow user to input new goal state
             goal_state = get_valid_eight_puzzle_state("Enter the 8-puzzle goal state: ")
-            puzzle.goal_state = tuple(goal_state)
+            puzzle.set_goal_state(goal_state)
             
         elif choice == '5':
             # Exit the program
             break
             
+        elif choice == '6':
+            # Solve using IDA* with Manhattan Distance heuristic
+            start_time = timeit.default_timer()
+            moves = puzzle.ida_star(puzzle.manhattan_distance)
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (IDA* MD): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (IDA* MD): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
+        elif choice == '7':
+            # Solve using IDA* with Out-of-Place heuristic
+            start_time = timeit.default_timer()
+            moves = puzzle.ida_star(puzzle.out_of_place)
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (IDA* OOPT): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (IDA* OOPT): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
+        elif choice == '8':
+            # Solve using bidirectional A* with Manhattan Distance heuristic
+            start_time = timeit.default_timer()
+            moves = puzzle.bidirectional_a_star(puzzle.manhattan_distance)
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (Bi-A* MD): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (Bi-A* MD): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
+        elif choice == '9':
+            # Solve using bidirectional A* with Out-of-Place heuristic
+            start_time = timeit.default_timer()
+            moves = puzzle.bidirectional_a_star(puzzle.out_of_place)
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (Bi-A* OOPT): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (Bi-A* OOPT): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
+        elif choice == '10':
+            # Solve using the distance table of the goal state
+            start_time = timeit.default_timer()
+            moves = puzzle.table_solve()
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (Table): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (Table): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            
+        elif choice == '11':
+            # Solve using additive pattern database heuristic
+            start_time = timeit.default_timer()
+            moves = puzzle.a_star(puzzle.pattern_database)
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (PDB): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (PDB): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
+        elif choice == '12':
+            # Solve using Manhattan Distance plus linear conflicts
+            start_time = timeit.default_timer()
+            moves = puzzle.a_star(puzzle.linear_conflict)
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (LC): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (LC): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
+        elif choice == '13':
+            # Solve using the max of pattern databases and linear conflicts
+            start_time = timeit.default_timer()
+            moves = puzzle.a_star(max_heuristic(puzzle.pattern_database, puzzle.linear_conflict))
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (Max): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (Max): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
+        elif choice == '14':
+            # Solve using IDA* with the max of pattern databases and linear conflicts
+            start_time = timeit.default_timer()
+            moves = puzzle.ida_star(max_heuristic(puzzle.pattern_database, puzzle.linear_conflict))
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (IDA* Max): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (IDA* Max): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
+        elif choice == '15':
+            # Solve using weighted A* with Manhattan Distance heuristic
+            start_time = timeit.default_timer()
+            moves = puzzle.weighted_a_star(puzzle.manhattan_distance, 2.0)
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (WA* MD): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (WA* MD): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
+        elif choice == '16':
+            # Solve using anytime A* with Manhattan Distance heuristic and a time budget
+            start_time = timeit.default_timer()
+            moves = puzzle.anytime_a_star(puzzle.manhattan_distance, 2.0, timeout=0.1)
+            elapsed_time = timeit.default_timer() - start_time
+            print(f"Sequence of moves (Anytime MD): {' '.join(moves) if moves else 'No solution'}")
+            print(f"No. of moves (Anytime MD): {len(moves) if moves else 0}")
+            print(f"Time taken: {elapsed_time:.6f}")
+            print(f"Search stats: {puzzle.stats}")
+            
         else:
             print("Invalid selection.")
 
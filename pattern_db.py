@@ -0,0 +1,168 @@
+# Additive pattern databases for the sliding puzzles
+# Used as heuristics by SlidingPuzzle (sliding_puzzle.py) and its subclasses
+
+from collections import deque  # For the 0-1 BFS
+
+UNREACHED = 0xFF  # Table entry of a pattern placement that was never reached
+
+# Largest number of tiles in a default pattern, by board size: the build
+# visits every placement of the pattern tiles and the blank, so bigger
+# boards need smaller patterns to stay buildable in memory and time
+DEFAULT_PATTERN_TILES = [(9, 4), (16, 5), (25, 4)]
+
+# Databases already built, keyed by board shape, goal state and pattern
+_pattern_databases = {}
+
+
+def default_patterns(puzzle):
+    """
+    Split the tiles of a puzzle into disjoint patterns.
+
+    Tiles are grouped in the reading order of their goal positions, so
+    every pattern covers a compact block of the goal board.
+
+    Args:
+        puzzle: SlidingPuzzle instance
+
+    Returns:
+        Tuple of patterns, each a tuple of tiles
+    """
+    size = puzzle.rows * puzzle.cols
+    group = DEFAULT_PATTERN_TILES[-1][1]
+    for cells, tiles in DEFAULT_PATTERN_TILES:
+        if size <= cells:
+            group = tiles
+            break
+    tiles = [tile for tile in puzzle.goal_state if tile != 0]
+    return tuple(tuple(tiles[i:i + group]) for i in range(0, len(tiles), group))
+
+
+def build_pattern_database(puzzle, pattern):
+    """
+    Compute the exact cost of placing the tiles of one pattern.
+
+    A 0-1 BFS runs from the goal over abstract states made of the positions
+    of the pattern tiles and of the blank; all other tiles are
+    indistinguishable. Moving a pattern tile costs 1 and moving any other
+    tile costs 0, so the costs of disjoint patterns can be added without
+    overestimating. Moves are reversible, so the backward search gives the
+    forward costs.
+
+    The result has one byte per placement of the pattern tiles, indexed by
+    their positions read as the digits of a number in base rows*cols, and
+    holds the cheapest cost over all blank positions.
+
+    Args:
+        puzzle: SlidingPuzzle instance whose goal state is used
+        pattern: Tuple of tiles (the blank excluded)
+
+    Returns:
+        Bytearray indexed by the placement of the pattern tiles
+    """
+    size = puzzle.rows * puzzle.cols
+    count = len(pattern)
+    # Abstract states are integers: pattern positions then the blank, in base size
+    costs = bytearray([UNREACHED]) * size ** (count + 1)
+    weights = [size ** (count - j) for j in range(count)]  # Digit weight of each pattern tile
+    blank_moves = [[new_blank for new_blank, _ in moves] for moves in puzzle.blank_moves]
+
+    goal = puzzle.goal_state
+    start = 0
+    for tile in pattern:
+        start = start * size + goal.index(tile)
+    start = start * size + goal.index(0)
+    costs[start] = 0
+    queue = deque([start])
+
+    while queue:
+        code = queue.popleft()
+        cost = costs[code]
+        rest, blank = divmod(code, size)
+        # Decode the positions of the pattern tiles, last tile first
+        positions = []
+        for _ in range(count):
+            rest, position = divmod(rest, size)
+            positions.append(position)
+        positions.reverse()
+        base = code - blank
+        for new_blank in blank_moves[blank]:
+            if new_blank in positions:
+                # A pattern tile slides into the blank, which costs 1
+                weight = weights[positions.index(new_blank)]
+                neighbor = base + (blank - new_blank) * weight + new_blank
+                if cost + 1 < costs[neighbor]:
+                    costs[neighbor] = cost + 1
+                    queue.append(neighbor)
+            else:
+                # Another tile moves, which is free
+                neighbor = base + new_blank
+                if cost < costs[neighbor]:
+                    costs[neighbor] = cost
+                    queue.appendleft(neighbor)
+
+    # Keep the cheapest cost of every placement over all blank positions
+    table = bytearray([UNREACHED]) * size ** count
+    for index in range(len(table)):
+        row = costs[index * size:(index + 1) * size]
+        table[index] = min(row)
+    return table
+
+
+def get_pattern_databases(puzzle, patterns=None):
+    """
+    Return the databases of a puzzle's goal, building them on first use.
+
+    Args:
+        puzzle: SlidingPuzzle instance
+        patterns: Disjoint tuples of tiles (default_patterns if omitted)
+
+    Returns:
+        List of (pattern, table) pairs
+    """
+    if patterns is None:
+        patterns = default_patterns(puzzle)
+    databases = []
+    for pattern in patterns:
+        key = (puzzle.rows, puzzle.cols, puzzle.goal_state, tuple(pattern))
+        table = _pattern_databases.get(key)
+        if table is None:
+            table = build_pattern_database(puzzle, tuple(pattern))
+            _pattern_databases[key] = table
+        databases.append((tuple(pattern), table))
+    return databases
+
+
+def drop_pattern_databases(puzzle):
+    """
+    Forget the cached databases of a puzzle's goal, e.g. when the goal goes out of use.
+
+    Args:
+        puzzle: SlidingPuzzle instance
+    """
+    prefix = (puzzle.rows, puzzle.cols, puzzle.goal_state)
+    for key in [key for key in _pattern_databases if key[:3] == prefix]:
+        del _pattern_databases[key]
+
+
+def pattern_distance(databases, state, size):
+    """
+    Additive pattern database heuristic of a state.
+
+    Args:
+        databases: List of (pattern, table) pairs from get_pattern_databases
+        state: Tuple representing puzzle state
+        size: Number of cells on the board
+
+    Returns:
+        Integer sum of the pattern costs, a lower bound on the moves to the goal
+    """
+    where = [0] * size
+    for position, tile in enumerate(state):
+        where[tile] = position
+    total = 0
+    for pattern, table in databases:
+        index = 0
+        for tile in pattern:
+            index = index * size + where[tile]
+        total += table[index]
+    return total
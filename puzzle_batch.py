@@ -0,0 +1,494 @@
+# Batch solver for the 5-puzzle and 8-puzzle
+# Streams start/goal pairs in and JSON results out, one instance per line
+
+import argparse  # For the command line interface
+import json      # For JSON lines output
+import os        # For the default number of worker processes
+import sys       # For stdin/stdout streams
+import timeit    # For measuring execution time
+from collections import OrderedDict, deque  # Per-goal puzzle cache, in-flight chunks
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait  # Worker pool
+from functools import partial  # For fixing the shape of larger boards
+from itertools import islice  # For cutting the input into chunks
+
+import pattern_db
+import puzzle_tables
+from Sava_1_1 import FivePuzzle
+from Sava_1_2 import EightPuzzle
+from search_stats import SearchStats
+from sliding_puzzle import SlidingPuzzle, max_heuristic
+
+PUZZLES = {
+    'five': FivePuzzle,
+    'eight': EightPuzzle,
+    'fifteen': partial(SlidingPuzzle, rows=4, cols=4),
+    'twenty-four': partial(SlidingPuzzle, rows=5, cols=5),
+}
+BOARD_SIZES = {'five': 6, 'eight': 9, 'fifteen': 16, 'twenty-four': 25}
+
+# Algorithm names accepted per puzzle type, mapped to how they are run
+ALGORITHMS = {
+    'five': {
+        'bfs': lambda puzzle: puzzle.bfs(packed=True),
+        'ids': lambda puzzle: puzzle.ids(packed=True),
+        'ids-tt': lambda puzzle: puzzle.transposition_ids(packed=True),
+        'bfs-vector': lambda puzzle: puzzle.vector_bfs(),
+        'table': lambda puzzle: puzzle.table_solve(),
+    },
+    'eight': {
+        'a_star-md': lambda puzzle: puzzle.a_star(puzzle.manhattan_distance, packed=True),
+        'a_star-oop': lambda puzzle: puzzle.a_star(puzzle.out_of_place, packed=True),
+        'a_star-md-heap': lambda puzzle: puzzle.a_star(puzzle.manhattan_distance, packed=True,
+                                                       open_list='heap'),
+        'a_star-oop-heap': lambda puzzle: puzzle.a_star(puzzle.out_of_place, packed=True,
+                                                        open_list='heap'),
+        'a_star-pdb': lambda puzzle: puzzle.a_star(puzzle.pattern_database, packed=True),
+        'a_star-lc': lambda puzzle: puzzle.a_star(puzzle.linear_conflict, packed=True),
+        'a_star-max': lambda puzzle: puzzle.a_star(max_pdb_lc(puzzle), packed=True),
+        'wa_star-md': lambda puzzle: puzzle.weighted_a_star(puzzle.manhattan_distance, WEIGHT, packed=True),
+        'wa_star-oop': lambda puzzle: puzzle.weighted_a_star(puzzle.out_of_place, WEIGHT, packed=True),
+        'anytime-md': lambda puzzle: puzzle.anytime_a_star(puzzle.manhattan_distance, WEIGHT,
+                                                           timeout=ANYTIME_TIMEOUT, packed=True),
+        'anytime-oop': lambda puzzle: puzzle.anytime_a_star(puzzle.out_of_place, WEIGHT,
+                                                            timeout=ANYTIME_TIMEOUT, packed=True),
+        'ida_star-md': lambda puzzle: puzzle.ida_star(puzzle.manhattan_distance),
+        'ida_star-pdb': lambda puzzle: puzzle.ida_star(puzzle.pattern_database),
+        'ida_star-lc': lambda puzzle: puzzle.ida_star(puzzle.linear_conflict),
+        'ida_star-max': lambda puzzle: puzzle.ida_star(max_pdb_lc(puzzle)),
+        'bfs-vector': lambda puzzle: puzzle.vector_bfs(),
+        'table': lambda puzzle: puzzle.table_solve(),
+    },
+    'fifteen': {
+        'ida_star-md': lambda puzzle: puzzle.ida_star(puzzle.manhattan_distance),
+        'ida_star-pdb': lambda puzzle: puzzle.ida_star(puzzle.pattern_database),
+        'ida_star-lc': lambda puzzle: puzzle.ida_star(puzzle.linear_conflict),
+        'ida_star-max': lambda puzzle: puzzle.ida_star(max_pdb_lc(puzzle)),
+    },
+    'twenty-four': {
+        'ida_star-md': lambda puzzle: puzzle.ida_star(puzzle.manhattan_distance),
+        'ida_star-pdb': lambda puzzle: puzzle.ida_star(puzzle.pattern_database),
+        'ida_star-lc': lambda puzzle: puzzle.ida_star(puzzle.linear_conflict),
+        'ida_star-max': lambda puzzle: puzzle.ida_star(max_pdb_lc(puzzle)),
+    },
+}
+# Algorithm used when --algorithm is not given
+DEFAULT_ALGORITHMS = {'five': 'bfs', 'eight': 'a_star-md', 'fifteen': 'ida_star-pdb',
+                      'twenty-four': 'ida_star-pdb'}
+
+WEIGHT = 2.0  # Heuristic weight of the bounded-suboptimal algorithms
+ANYTIME_TIMEOUT = 0.05  # Seconds an anytime search may spend on one instance
+
+GOAL_CACHE_SIZE = 32  # Puzzles (and their per-goal tables) kept between instances
+CHUNKS_PER_WORKER = 2  # Chunks queued per worker process, bounds memory in parallel mode
+
+# Per-process solver state, set up once in every worker by init_worker
+_worker = {}
+
+
+def max_pdb_lc(puzzle):
+    """
+    Max of the pattern database and linear conflict heuristics of a puzzle.
+
+    The pattern database lookup is the cheaper of the two, so it goes first.
+
+    Args:
+        puzzle: SlidingPuzzle instance
+
+    Returns:
+        Combined heuristic (see sliding_puzzle.max_heuristic)
+    """
+    return max_heuristic(puzzle.pattern_database, puzzle.linear_conflict)
+
+
+def parse_state(tokens, size):
+    """
+    Convert a list of strings into a validated puzzle state.
+
+    Args:
+        tokens: List of strings, one per cell
+        size: Number of cells on the board
+
+    Returns:
+        Tuple of integers representing a valid puzzle state
+
+    Raises:
+        ValueError: If the tokens are not each number from 0 to size - 1 exactly once
+    """
+    if len(tokens) != size:
+        raise ValueError(f"Please enter exactly {size} numbers.")
+    state = tuple(int(token) for token in tokens)
+    if sorted(state) != list(range(size)):
+        raise ValueError(f"You must use each number from 0 to {size - 1} exactly once.")
+    return state
+
+
+def parse_instance(line, size):
+    """
+    Parse one input line into a start and a goal state.
+
+    A line holds the start tiles followed by the goal tiles, optionally
+    separated by '|', e.g. "1 2 3 4 0 5 | 1 2 3 4 5 0".
+
+    Args:
+        line: Input line
+        size: Number of cells on the board
+
+    Returns:
+        Tuple (start_state, goal_state)
+
+    Raises:
+        ValueError: If the line does not hold two valid states
+    """
+    tokens = line.replace('|', ' ').split()
+    if len(tokens) != 2 * size:
+        raise ValueError(f"Expected {2 * size} numbers (start then goal), got {len(tokens)}.")
+    return parse_state(tokens[:size], size), parse_state(tokens[size:], size)
+
+
+def read_instances(lines, size):
+    """
+    Lazily turn input lines into numbered instances, skipping blanks and comments.
+
+    Args:
+        lines: Iterable of input lines
+        size: Number of cells on the board
+
+    Yields:
+        Tuples (line_number, start_state, goal_state, error); error is None
+        for valid lines and a message (with both states None) otherwise
+    """
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            start_state, goal_state = parse_instance(line, size)
+        except ValueError as error:
+            yield line_number, None, None, str(error)
+        else:
+            yield line_number, start_state, goal_state, None
+
+
+def get_puzzle(cache, puzzle_type, start_state, goal_state, table_dir=None):
+    """
+    Get a puzzle for a goal from the cache, so per-goal tables are built once.
+
+    The cache keeps the most recently used goals only, and the distance
+    table and pattern databases of an evicted goal are dropped from their
+    module caches too, which bounds memory no matter how many distinct
+    goals the input contains.
+
+    Args:
+        cache: OrderedDict mapping goal states to puzzle instances
+        puzzle_type: 'five' or 'eight'
+        start_state: Start state of the instance
+        goal_state: Goal state of the instance
+        table_dir: Directory of memory-mapped distance tables, used for new
+                   goals when given (see puzzle_tables.open_distance_table)
+
+    Returns:
+        Puzzle instance set up for the start and goal states
+    """
+    puzzle = cache.get(goal_state)
+    if puzzle is None:
+        puzzle = PUZZLES[puzzle_type](start_state, goal_state)
+        if table_dir is not None:
+            puzzle_tables.open_distance_table(puzzle, table_dir)
+        cache[goal_state] = puzzle
+        if len(cache) > GOAL_CACHE_SIZE:
+            _, evicted = cache.popitem(last=False)  # Drop the least recently used goal
+            puzzle_tables.drop_distance_table(evicted)
+            pattern_db.drop_pattern_databases(evicted)
+    else:
+        cache.move_to_end(goal_state)
+        puzzle.set_start_state(start_state)
+    return puzzle
+
+
+def solve_instance(puzzle, puzzle_type, algorithm):
+    """
+    Solve the puzzle's current start/goal pair and describe the result.
+
+    Args:
+        puzzle: Puzzle instance set up for the instance
+        puzzle_type: 'five' or 'eight'
+        algorithm: Algorithm name from ALGORITHMS[puzzle_type]
+
+    Returns:
+        Dictionary with the moves, their number and the time taken, plus
+        the suboptimality bound for the bounded-suboptimal algorithms
+    """
+    puzzle.stats = SearchStats()  # Table lookups attach no statistics of their own
+    start_time = timeit.default_timer()
+    moves = ALGORITHMS[puzzle_type][algorithm](puzzle)
+    elapsed_time = timeit.default_timer() - start_time
+    result = {
+        'start': list(puzzle.start_state),
+        'goal': list(puzzle.goal_state),
+        'algorithm': algorithm,
+        'solved': moves is not None,
+        'moves': ' '.join(moves) if moves is not None else None,
+        'length': len(moves) if moves is not None else None,
+        'time': elapsed_time,
+    }
+    if puzzle.stats.suboptimality_bound is not None:
+        result['bound'] = puzzle.stats.suboptimality_bound
+    return result
+
+
+def solve_task(cache, puzzle_type, algorithm, instance, table_dir=None):
+    """
+    Solve one instance produced by read_instances.
+
+    Args:
+        cache: OrderedDict of puzzles per goal (see get_puzzle)
+        puzzle_type: 'five' or 'eight'
+        algorithm: Algorithm name from ALGORITHMS[puzzle_type]
+        instance: Tuple (line_number, start_state, goal_state, error)
+        table_dir: Directory of memory-mapped distance tables, or None
+
+    Returns:
+        Result dictionary tagged with the input line number
+    """
+    line_number, start_state, goal_state, error = instance
+    if error is not None:
+        return {'line': line_number, 'error': error}
+    puzzle = get_puzzle(cache, puzzle_type, start_state, goal_state, table_dir)
+    result = {'line': line_number}
+    result.update(solve_instance(puzzle, puzzle_type, algorithm))
+    return result
+
+
+def solve_stream(lines, puzzle_type, algorithm, table_dir=None):
+    """
+    Solve every instance of an input stream in order.
+
+    Lines are read and results produced one at a time, so memory use does
+    not depend on the input size.
+
+    Args:
+        lines: Iterable of input lines
+        puzzle_type: 'five' or 'eight'
+        algorithm: Algorithm name from ALGORITHMS[puzzle_type]
+        table_dir: Directory of memory-mapped distance tables, or None
+
+    Yields:
+        Result dictionaries, each tagged with its input line number
+    """
+    cache = OrderedDict()
+    for instance in read_instances(lines, BOARD_SIZES[puzzle_type]):
+        yield solve_task(cache, puzzle_type, algorithm, instance, table_dir)
+
+
+def solve_stream_grouped(lines, puzzle_type):
+    """
+    Solve every instance of an input stream with one backward search per goal.
+
+    All instances are read first and grouped by goal; each group is solved
+    by SlidingPuzzle.solve_many, so many starts sharing a goal cost about as
+    much as the deepest of them. Unlike solve_stream, memory grows with the
+    input size.
+
+    Args:
+        lines: Iterable of input lines
+        puzzle_type: Puzzle type from PUZZLES (boards up to 3x3)
+
+    Yields:
+        Result dictionaries in input order, each tagged with its input line
+        number; 'time' is the time of the group's search divided by its size
+    """
+    instances = list(read_instances(lines, BOARD_SIZES[puzzle_type]))
+    groups = OrderedDict()  # goal -> indexes of its instances
+    for index, (_, start_state, goal_state, error) in enumerate(instances):
+        if error is None:
+            groups.setdefault(goal_state, []).append(index)
+
+    results = [None] * len(instances)
+    for goal_state, indexes in groups.items():
+        starts = [instances[index][1] for index in indexes]
+        puzzle = PUZZLES[puzzle_type](goal_state, goal_state)
+        start_time = timeit.default_timer()
+        paths = puzzle.solve_many(starts)
+        elapsed_time = (timeit.default_timer() - start_time) / len(indexes)
+        for index, start_state, moves in zip(indexes, starts, paths):
+            results[index] = {
+                'line': instances[index][0],
+                'start': list(start_state),
+                'goal': list(goal_state),
+                'algorithm': 'bfs-many',
+                'solved': moves is not None,
+                'moves': ' '.join(moves) if moves is not None else None,
+                'length': len(moves) if moves is not None else None,
+                'time': elapsed_time,
+            }
+
+    for (line_number, _, _, error), result in zip(instances, results):
+        yield result if error is None else {'line': line_number, 'error': error}
+
+
+def init_worker(puzzle_type, algorithm, table_dir):
+    """
+    Set up the solver state of a worker process.
+
+    Runs once per worker, so the per-goal puzzle cache (heuristic tables,
+    solvability, distance tables) lives for the whole batch instead of
+    being rebuilt or shipped with every task.
+
+    Args:
+        puzzle_type: 'five' or 'eight'
+        algorithm: Algorithm name from ALGORITHMS[puzzle_type]
+        table_dir: Directory of memory-mapped distance tables, or None
+    """
+    _worker['puzzle_type'] = puzzle_type
+    _worker['algorithm'] = algorithm
+    _worker['table_dir'] = table_dir
+    _worker['cache'] = OrderedDict()
+
+
+def solve_chunk(chunk):
+    """
+    Solve a chunk of instances inside a worker process.
+
+    Args:
+        chunk: List of instances produced by read_instances
+
+    Returns:
+        List of result dictionaries in the order of the chunk
+    """
+    return [solve_task(_worker['cache'], _worker['puzzle_type'], _worker['algorithm'],
+                       instance, _worker['table_dir'])
+            for instance in chunk]
+
+
+def solve_stream_parallel(lines, puzzle_type, algorithm, workers=None, chunk_size=64,
+                          ordered=True, table_dir=None):
+    """
+    Solve every instance of an input stream on a pool of worker processes.
+
+    The input is cut into chunks of chunk_size instances and at most
+    CHUNKS_PER_WORKER chunks per worker are in flight at a time, so memory
+    stays bounded however long the input is.
+
+    Args:
+        lines: Iterable of input lines
+        puzzle_type: 'five' or 'eight'
+        algorithm: Algorithm name from ALGORITHMS[puzzle_type]
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_size: Number of instances sent to a worker at once
+        ordered: If True, yield results in input order; otherwise as soon as
+                 each chunk is done
+        table_dir: Directory of memory-mapped distance tables, or None
+
+    Yields:
+        Result dictionaries, each tagged with its input line number
+
+    Raises:
+        ValueError: If chunk_size is smaller than 1
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be at least 1, got {chunk_size}")
+    workers = workers or os.cpu_count() or 1
+    instances = read_instances(lines, BOARD_SIZES[puzzle_type])
+    chunks = iter(lambda: list(islice(instances, chunk_size)), [])
+    window = workers * CHUNKS_PER_WORKER
+
+    with ProcessPoolExecutor(workers, initializer=init_worker,
+                             initargs=(puzzle_type, algorithm, table_dir)) as executor:
+        pending = deque()
+        exhausted = False
+        while True:
+            # Keep the window of in-flight chunks full
+            while not exhausted and len(pending) < window:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    pending.append(executor.submit(solve_chunk, chunk))
+            if not pending:
+                break
+            if ordered:
+                yield from pending.popleft().result()
+            else:
+                done, not_done = wait(pending, return_when=FIRST_COMPLETED)
+                pending = deque(not_done)
+                for future in done:
+                    yield from future.result()
+
+
+def algorithm_help():
+    """
+    Describe the --algorithm choices, generated from ALGORITHMS so it stays complete.
+
+    Returns:
+        Help text listing the algorithms and the default of every puzzle type
+    """
+    choices = "; ".join(f"{', '.join(names)} for {puzzle_type}"
+                        for puzzle_type, names in ALGORITHMS.items())
+    defaults = " / ".join(DEFAULT_ALGORITHMS[puzzle_type] for puzzle_type in ALGORITHMS)
+    return f"{choices} (default: {defaults})"
+
+
+def main(argv=None):
+    """
+    Command line entry point of the batch solver.
+
+    Example:
+        python puzzle_batch.py --puzzle eight --algorithm a_star-md instances.txt > results.jsonl
+        python puzzle_batch.py --puzzle eight --workers 8 --unordered instances.txt
+        python puzzle_batch.py --puzzle eight --group-by-goal instances.txt
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="Solve many sliding puzzle instances, one per line.")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="file with one 'start | goal' instance per line ('-' for stdin)")
+    parser.add_argument('--puzzle', choices=sorted(PUZZLES), default='eight',
+                        help="puzzle type (default: eight)")
+    parser.add_argument('--algorithm',
+                        help=algorithm_help())
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes, 0 for one per CPU (default: 1, solve in-process)")
+    parser.add_argument('--chunk-size', type=int, default=64,
+                        help="instances sent to a worker at once (default: 64)")
+    parser.add_argument('--unordered', action='store_true',
+                        help="write results as soon as they are ready instead of in input order")
+    parser.add_argument('--table-dir',
+                        help="directory of memory-mapped distance tables shared by all workers")
+    parser.add_argument('--group-by-goal', action='store_true',
+                        help="solve all starts of each goal with one backward BFS (five and eight only, "
+                             "reads the whole input first)")
+    args = parser.parse_args(argv)
+
+    algorithm = args.algorithm or DEFAULT_ALGORITHMS[args.puzzle]
+    if algorithm not in ALGORITHMS[args.puzzle]:
+        parser.error(f"algorithm {algorithm!r} is not available for the {args.puzzle} puzzle")
+    if args.table_dir and BOARD_SIZES[args.puzzle] > puzzle_tables.MAX_TABLE_CELLS:
+        parser.error(f"distance tables are not available for the {args.puzzle} puzzle")
+    if args.workers < 0:
+        parser.error(f"--workers must be 0 (one per CPU) or more, got {args.workers}")
+    if args.chunk_size < 1:
+        parser.error(f"--chunk-size must be at least 1, got {args.chunk_size}")
+    if args.group_by_goal and BOARD_SIZES[args.puzzle] > puzzle_tables.MAX_TABLE_CELLS:
+        parser.error(f"--group-by-goal is not available for the {args.puzzle} puzzle")
+    if args.group_by_goal and args.workers != 1:
+        parser.error("--group-by-goal runs in-process, it cannot be combined with --workers")
+
+    source = sys.stdin if args.input == '-' else open(args.input)
+    try:
+        if args.group_by_goal:
+            results = solve_stream_grouped(source, args.puzzle)
+        elif args.workers == 1:
+            results = solve_stream(source, args.puzzle, algorithm, args.table_dir)
+        else:
+            results = solve_stream_parallel(source, args.puzzle, algorithm, args.workers or None,
+                                            args.chunk_size, not args.unordered, args.table_dir)
+        for result in results:
+            sys.stdout.write(json.dumps(result) + '\n')
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+if __name__ == "__main__":
+    main()  # Run the batch solver when script is executed directly
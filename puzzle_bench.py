@@ -0,0 +1,324 @@
+# Benchmark suite for the 5-puzzle and 8-puzzle solvers
+# Seeded random solvable instances, bucketed by optimal depth, JSON results
+
+import argparse   # For the command line interface
+import json       # For machine-readable results
+import math       # For percentile ranks
+import platform   # For recording the benchmark environment
+import random     # For seeded instance generation
+import sys        # For the output stream and exit status
+import timeit     # For measuring execution time
+import tracemalloc  # For peak Python memory of a solve
+
+try:
+    import resource  # Peak RSS, not available on Windows
+except ImportError:
+    resource = None
+
+import puzzle_tables
+import puzzle_vector
+from puzzle_batch import ALGORITHMS, PUZZLES
+from search_stats import SearchStats
+
+DEFAULT_GOALS = {'five': (1, 2, 3, 4, 5, 0), 'eight': (1, 2, 3, 4, 5, 6, 7, 8, 0)}
+
+# Optimal solution depth ranges (inclusive) used to bucket instances
+DEPTH_BUCKETS = {
+    'five': [(1, 7), (8, 14), (15, 21)],
+    'eight': [(1, 10), (11, 20), (21, 25), (26, 31)],
+}
+
+# Algorithms run by default for each puzzle type (names from puzzle_batch.ALGORITHMS)
+BENCH_ALGORITHMS = {
+    'five': ['bfs', 'ids', 'ids-tt'],
+    'eight': ['a_star-md', 'a_star-md-heap', 'a_star-oop', 'a_star-oop-heap', 'a_star-pdb',
+              'a_star-lc', 'a_star-max'],
+}
+if puzzle_vector.np is not None:  # The vectorized BFS only runs with NumPy installed
+    for names in BENCH_ALGORITHMS.values():
+        names.append('bfs-vector')
+
+MAX_ATTEMPTS = 1000000  # Random states tried before giving up on filling the buckets
+
+
+def generate_instances(puzzle_type, goal_state, per_bucket, seed):
+    """
+    Draw seeded random solvable start states and bucket them by optimal depth.
+
+    Start states are uniform random permutations; unsolvable ones are
+    dropped and the exact optimal depth of the others is read from the
+    distance table of the goal (see puzzle_tables).
+
+    Args:
+        puzzle_type: 'five' or 'eight'
+        goal_state: Goal state shared by all instances
+        per_bucket: Number of instances wanted in every depth bucket
+        seed: Seed of the random generator
+
+    Returns:
+        Dictionary mapping (low, high) depth buckets to lists of (start_state, depth)
+
+    Raises:
+        RuntimeError: If the buckets cannot be filled in MAX_ATTEMPTS draws
+    """
+    rng = random.Random(seed)
+    puzzle = PUZZLES[puzzle_type](goal_state, goal_state)
+    table = puzzle_tables.get_distance_table(puzzle)
+    buckets = {bucket: [] for bucket in DEPTH_BUCKETS[puzzle_type]}
+    missing = len(buckets) * per_bucket
+
+    for _ in range(MAX_ATTEMPTS):
+        if missing == 0:
+            return buckets
+        state = list(goal_state)
+        rng.shuffle(state)
+        state = tuple(state)
+        depth = puzzle_tables.table_distance(puzzle, state, table)
+        if depth is None:
+            continue  # Unsolvable against this goal
+        for (low, high), instances in buckets.items():
+            if low <= depth <= high and len(instances) < per_bucket:
+                instances.append((state, depth))
+                missing -= 1
+    if missing == 0:
+        return buckets
+    raise RuntimeError(f"Could not fill the depth buckets in {MAX_ATTEMPTS} attempts")
+
+
+def percentile(values, fraction):
+    """
+    Nearest-rank percentile of a list of numbers.
+
+    Args:
+        values: Non-empty list of numbers
+        fraction: Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        The smallest value with at least that fraction of values at or below it
+    """
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(len(ordered) * fraction) - 1)]
+
+
+def peak_rss_kb():
+    """
+    Peak resident set size of this process so far.
+
+    Returns:
+        Kilobytes, or None where the resource module is unavailable
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # macOS reports bytes
+
+
+def bench_bucket(puzzle, puzzle_type, algorithm, instances, warmup, repeat):
+    """
+    Time one algorithm on the instances of one depth bucket.
+
+    Every instance is run warmup times untimed, then repeat times timed.
+    Search counters come from puzzle.stats, reset before every timed run so
+    algorithms without statistics (table lookups) report zero; the peak Python allocation of a
+    solve is measured in one extra run under tracemalloc, so tracing does
+    not distort the timings.
+
+    Args:
+        puzzle: Puzzle instance for the shared goal
+        puzzle_type: 'five' or 'eight'
+        algorithm: Algorithm name from puzzle_batch.ALGORITHMS[puzzle_type]
+        instances: List of (start_state, depth)
+        warmup: Untimed runs per instance
+        repeat: Timed runs per instance (at least 1)
+
+    Returns:
+        Dictionary of latency, throughput and peak Python allocation figures
+    """
+    solve = ALGORITHMS[puzzle_type][algorithm]
+    clock = timeit.default_timer
+    latencies = []
+    expanded = []
+    total_expanded = 0
+    total_time = 0.0
+    peak_traced = 0
+    suboptimal = 0
+
+    for state, depth in instances:
+        puzzle.set_start_state(state)
+        for _ in range(warmup):
+            solve(puzzle)
+        for _ in range(repeat):
+            puzzle.stats = SearchStats()  # Table lookups attach no statistics of their own
+            started = clock()
+            moves = solve(puzzle)
+            elapsed = clock() - started
+            latencies.append(elapsed)
+            total_time += elapsed
+            total_expanded += puzzle.stats.nodes_expanded
+        if moves is None or len(moves) != depth:
+            suboptimal += 1  # Longer than the optimal depth from the distance table
+        expanded.append(puzzle.stats.nodes_expanded)
+
+        tracemalloc.start()
+        solve(puzzle)
+        peak_traced = max(peak_traced, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return {
+        'instances': len(instances),
+        'runs': len(latencies),
+        'suboptimal': suboptimal,
+        'median_latency': percentile(latencies, 0.5),
+        'p95_latency': percentile(latencies, 0.95),
+        'median_expanded': percentile(expanded, 0.5),
+        'nodes_per_second': total_expanded / total_time if total_time > 0 else None,
+        'peak_tracemalloc_bytes': peak_traced,
+    }
+
+
+def run_benchmark(puzzle_type, algorithms=None, goal_state=None, per_bucket=5,
+                  warmup=1, repeat=3, seed=0):
+    """
+    Run the benchmark for one puzzle type.
+
+    Args:
+        puzzle_type: 'five' or 'eight'
+        algorithms: Algorithm names to run (defaults to BENCH_ALGORITHMS)
+        goal_state: Goal state of every instance (defaults to DEFAULT_GOALS)
+        per_bucket: Instances per depth bucket
+        warmup: Untimed runs per instance
+        repeat: Timed runs per instance
+        seed: Seed of the instance generator
+
+    Returns:
+        JSON-serialisable dictionary with run metadata (including the peak
+        RSS of the whole run) and one result per algorithm and depth bucket
+    """
+    algorithms = algorithms or BENCH_ALGORITHMS[puzzle_type]
+    goal_state = tuple(goal_state or DEFAULT_GOALS[puzzle_type])
+    buckets = generate_instances(puzzle_type, goal_state, per_bucket, seed)
+    puzzle = PUZZLES[puzzle_type](goal_state, goal_state)
+
+    results = []
+    for algorithm in algorithms:
+        for (low, high), instances in buckets.items():
+            result = {'puzzle': puzzle_type, 'algorithm': algorithm, 'depth': f"{low}-{high}"}
+            result.update(bench_bucket(puzzle, puzzle_type, algorithm, instances, warmup, repeat))
+            results.append(result)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'goal': list(goal_state),
+            'seed': seed,
+            'per_bucket': per_bucket,
+            'warmup': warmup,
+            'repeat': repeat,
+            'peak_rss_kb': peak_rss_kb(),  # Whole run, RSS cannot be attributed to one row
+        },
+        'results': results,
+    }
+
+
+def compare_results(old, new, tolerance=0.1):
+    """
+    Compare two benchmark reports on median latency.
+
+    Median expansions are carried along, so a change in search effort can be
+    told apart from a change in the cost per node.
+
+    Args:
+        old: Report produced by run_benchmark (the baseline)
+        new: Report produced by run_benchmark (the candidate)
+        tolerance: Allowed relative slowdown before a row counts as a regression
+
+    Returns:
+        List of dictionaries (puzzle, algorithm, depth, old, new, ratio,
+        old_expanded, new_expanded, regression) for every row present in
+        both reports
+    """
+    baseline = {(row['puzzle'], row['algorithm'], row['depth']): row for row in old['results']}
+    rows = []
+    for row in new['results']:
+        key = (row['puzzle'], row['algorithm'], row['depth'])
+        if key not in baseline:
+            continue
+        before = baseline[key]['median_latency']
+        after = row['median_latency']
+        ratio = after / before if before > 0 else None
+        rows.append({
+            'puzzle': key[0], 'algorithm': key[1], 'depth': key[2],
+            'old': before, 'new': after, 'ratio': ratio,
+            'old_expanded': baseline[key]['median_expanded'], 'new_expanded': row['median_expanded'],
+            'regression': ratio is not None and ratio > 1 + tolerance,
+        })
+    return rows
+
+
+def main(argv=None):
+    """
+    Command line entry point of the benchmark.
+
+    Examples:
+        python puzzle_bench.py --puzzle eight --output bench.json
+        python puzzle_bench.py --puzzle eight --compare bench.json
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        Exit status: 1 if --compare found a regression, 0 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the sliding puzzle solvers.")
+    parser.add_argument('--puzzle', choices=sorted(DEPTH_BUCKETS), default='eight',
+                        help="puzzle type (default: eight)")
+    parser.add_argument('--algorithm', action='append',
+                        help="algorithm to run, may be repeated (default: the standard set)")
+    parser.add_argument('--instances', type=int, default=5, help="instances per depth bucket (default: 5)")
+    parser.add_argument('--warmup', type=int, default=1, help="untimed runs per instance (default: 1)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per instance (default: 3)")
+    parser.add_argument('--seed', type=int, default=0, help="instance generator seed (default: 0)")
+    parser.add_argument('--output', help="write the JSON report to this file instead of stdout")
+    parser.add_argument('--compare', help="baseline JSON report to compare median latencies against")
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="relative slowdown counted as a regression (default: 0.1)")
+    args = parser.parse_args(argv)
+    if args.instances < 1:
+        parser.error(f"--instances must be at least 1, got {args.instances}")
+    if args.repeat < 1:
+        parser.error(f"--repeat must be at least 1, got {args.repeat}")
+    if args.warmup < 0:
+        parser.error(f"--warmup must be 0 or more, got {args.warmup}")
+
+    for algorithm in args.algorithm or []:
+        if algorithm not in ALGORITHMS[args.puzzle]:
+            parser.error(f"algorithm {algorithm!r} is not available for the {args.puzzle} puzzle")
+
+    report = run_benchmark(args.puzzle, args.algorithm, per_bucket=args.instances,
+                           warmup=args.warmup, repeat=args.repeat, seed=args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    elif not args.compare:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressed = False
+        for row in compare_results(baseline, report, args.tolerance):
+            regressed = regressed or row['regression']
+            ratio = 'n/a' if row['ratio'] is None else f"{row['ratio']:.2f}"
+            print(f"{row['puzzle']} {row['algorithm']} depth {row['depth']}: "
+                  f"{row['old']:.6f}s -> {row['new']:.6f}s (x{ratio}), "
+                  f"expanded {row['old_expanded']} -> {row['new_expanded']}"
+                  f"{'  REGRESSION' if row['regression'] else ''}")
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())  # Run the benchmark when script is executed directly
@@ -0,0 +1,472 @@
+# Asynchronous solver service for the sliding puzzles
+# Runs solves in an executor, coalesces identical requests and caches results
+
+import argparse  # For the command line interface
+import asyncio   # For the event loop, the Unix socket server and the client
+import json      # For the JSON lines protocol
+import os        # For removing stale socket files
+import threading  # For per-thread puzzle caches in thread executors
+from collections import OrderedDict  # For the LRU result cache
+from concurrent.futures import ProcessPoolExecutor  # Default executor
+
+from puzzle_batch import ALGORITHMS, BOARD_SIZES, DEFAULT_ALGORITHMS, get_puzzle, solve_instance
+
+DEFAULT_CACHE_BYTES = 16 * 1024 * 1024  # Result cache budget
+ENTRY_OVERHEAD = 200  # Rough bytes of a cached result besides its moves
+
+# Per-process (and per-thread) puzzles per goal, so heuristic, pattern and
+# distance tables are built once per worker instead of once per request
+_local = threading.local()
+
+
+def solve_request(puzzle_type, start_state, goal_state, algorithm):
+    """
+    Solve one request inside an executor worker.
+
+    Args:
+        puzzle_type: Puzzle type from puzzle_batch.PUZZLES
+        start_state: Tuple representing the start state
+        goal_state: Tuple representing the goal state
+        algorithm: Algorithm name from puzzle_batch.ALGORITHMS[puzzle_type]
+
+    Returns:
+        Result dictionary as produced by puzzle_batch.solve_instance
+    """
+    caches = getattr(_local, 'caches', None)
+    if caches is None:
+        caches = _local.caches = {}
+    cache = caches.setdefault(puzzle_type, OrderedDict())
+    puzzle = get_puzzle(cache, puzzle_type, start_state, goal_state)
+    return solve_instance(puzzle, puzzle_type, algorithm)
+
+
+def check_state(name, tiles, size):
+    """
+    Validate a state received from a service client.
+
+    Unlike puzzle_batch.parse_state, nothing is converted: JSON floats,
+    booleans and strings are rejected instead of being read as tiles.
+
+    Args:
+        name: Field name used in error messages, e.g. 'start'
+        tiles: Value received for the state
+        size: Number of cells on the board
+
+    Returns:
+        Tuple of integers representing a valid puzzle state
+
+    Raises:
+        ValueError: If tiles is not a list of each integer from 0 to size - 1 exactly once
+    """
+    if not isinstance(tiles, (list, tuple)):
+        raise ValueError(f"'{name}' must be a list of {size} integers")
+    if len(tiles) != size:
+        raise ValueError(f"'{name}' must hold {size} tiles, got {len(tiles)}")
+    for tile in tiles:
+        if not isinstance(tile, int) or isinstance(tile, bool):
+            raise ValueError(f"'{name}' tiles must be integers, got {tile!r}")
+    if sorted(tiles) != list(range(size)):
+        raise ValueError(f"'{name}' must hold each integer from 0 to {size - 1} exactly once")
+    return tuple(tiles)
+
+
+def result_size(result):
+    """
+    Estimate the memory held by a cached result.
+
+    Args:
+        result: Result dictionary
+
+    Returns:
+        Approximate size in bytes
+    """
+    moves = result.get('moves') or ''
+    return ENTRY_OVERHEAD + len(moves) + 8 * (len(result['start']) + len(result['goal']))
+
+
+class SolverService:
+    """
+    Asyncio front end of the solvers.
+
+    Solves run in an executor so the event loop stays responsive. Requests
+    for the same (puzzle, start, goal, algorithm) that arrive while one is
+    being solved share that computation, and finished results are kept in
+    an LRU cache bounded by their estimated size in bytes.
+
+    Attributes:
+        hits: Requests answered from the result cache
+        misses: Requests that started a computation
+        coalesced: Requests that joined a computation already in flight
+    """
+
+    def __init__(self, executor=None, workers=None, cache_bytes=DEFAULT_CACHE_BYTES):
+        """
+        Create the service.
+
+        Args:
+            executor: concurrent.futures executor to run solves in; by default
+                      a ProcessPoolExecutor of workers processes owned by the service
+            workers: Number of worker processes of the default executor
+                     (defaults to the CPU count)
+            cache_bytes: Size budget of the result cache, 0 disables caching
+        """
+        self.owns_executor = executor is None
+        self.executor = ProcessPoolExecutor(workers) if executor is None else executor
+        self.cache_bytes = cache_bytes
+        self.cache = OrderedDict()  # key -> (result, size), least recently used first
+        self.cached_bytes = 0
+        self.in_flight = {}  # key -> future of the running computation
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def request_key(self, puzzle_type, start_state, goal_state, algorithm=None):
+        """
+        Validate a request and build the key identifying its computation.
+
+        Args:
+            puzzle_type: Puzzle type from puzzle_batch.PUZZLES
+            start_state: Sequence of tiles of the start state
+            goal_state: Sequence of tiles of the goal state
+            algorithm: Algorithm name (defaults to puzzle_batch.DEFAULT_ALGORITHMS)
+
+        Returns:
+            Tuple (puzzle_type, start_state, goal_state, algorithm)
+
+        Raises:
+            ValueError: If the puzzle type, algorithm or states are invalid
+        """
+        if puzzle_type not in ALGORITHMS:
+            raise ValueError(f"Unknown puzzle type {puzzle_type!r}")
+        algorithm = algorithm or DEFAULT_ALGORITHMS[puzzle_type]
+        if algorithm not in ALGORITHMS[puzzle_type]:
+            raise ValueError(f"algorithm {algorithm!r} is not available for the {puzzle_type} puzzle")
+        size = BOARD_SIZES[puzzle_type]
+        return (puzzle_type, check_state('start', start_state, size),
+                check_state('goal', goal_state, size), algorithm)
+
+    async def solve(self, puzzle_type, start_state, goal_state, algorithm=None):
+        """
+        Solve a puzzle instance without blocking the event loop.
+
+        Args:
+            puzzle_type: Puzzle type from puzzle_batch.PUZZLES
+            start_state: Sequence of tiles of the start state
+            goal_state: Sequence of tiles of the goal state
+            algorithm: Algorithm name (defaults to puzzle_batch.DEFAULT_ALGORITHMS)
+
+        Returns:
+            Result dictionary as produced by puzzle_batch.solve_instance, plus
+            'cached': True when it came from the result cache
+
+        Raises:
+            ValueError: If the puzzle type, algorithm or states are invalid
+        """
+        key = self.request_key(puzzle_type, start_state, goal_state, algorithm)
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return dict(entry[0], cached=True)
+
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, solve_request, *key)
+            self.in_flight[key] = future
+            future.add_done_callback(lambda done: self.finish(key, done))
+        # Shielded, so a cancelled caller does not cancel the shared computation
+        result = await asyncio.shield(future)
+        return dict(result, cached=False)
+
+    def finish(self, key, future):
+        """
+        Move a finished computation from the in-flight table into the cache.
+
+        Args:
+            key: Request key of the computation
+            future: Its completed future
+        """
+        del self.in_flight[key]
+        if future.cancelled() or future.exception() is not None:
+            return  # Failures are not cached, the next request retries
+        self.store(key, future.result())
+
+    def store(self, key, result):
+        """
+        Add a result to the cache, evicting least recently used results over budget.
+
+        Args:
+            key: Request key
+            result: Result dictionary
+        """
+        size = result_size(result)
+        if size > self.cache_bytes:
+            return  # Would not fit even in an empty cache
+        old = self.cache.pop(key, None)
+        if old is not None:
+            self.cached_bytes -= old[1]
+        self.cache[key] = (result, size)
+        self.cached_bytes += size
+        while self.cached_bytes > self.cache_bytes:
+            _, (_, evicted_size) = self.cache.popitem(last=False)
+            self.cached_bytes -= evicted_size
+
+    def stats(self):
+        """
+        Describe the cache and request counters.
+
+        Returns:
+            Dictionary of counters
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'in_flight': len(self.in_flight),
+            'cached_results': len(self.cache),
+            'cached_bytes': self.cached_bytes,
+        }
+
+    async def handle_request(self, request):
+        """
+        Answer one decoded JSON request.
+
+        A request holds 'puzzle', 'start', 'goal' and optionally 'algorithm'
+        and 'id'; {"stats": true} asks for the counters instead.
+
+        Args:
+            request: Dictionary decoded from a request line
+
+        Returns:
+            Response dictionary, echoing the request id
+        """
+        response = {'id': request.get('id')} if isinstance(request, dict) else {'id': None}
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("A request must be a JSON object")
+            if request.get('stats'):
+                response['stats'] = self.stats()
+            else:
+                response.update(await self.solve(request.get('puzzle'), request.get('start') or [],
+                                                 request.get('goal') or [], request.get('algorithm')))
+        except (TypeError, ValueError) as error:
+            response['error'] = str(error)
+        except Exception as error:  # A failed solve must still get an answer
+            response['error'] = f"{type(error).__name__}: {error}"
+        return response
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serve one client connection of the JSON lines protocol.
+
+        Every request line is answered by one response line. Requests are
+        handled concurrently, so responses may come back out of order and
+        carry the request id for matching.
+
+        Args:
+            reader: asyncio.StreamReader of the connection
+            writer: asyncio.StreamWriter of the connection
+        """
+        tasks = set()
+
+        async def answer(line):
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                response = {'id': None, 'error': f"Invalid JSON: {error}"}
+            else:
+                response = await self.handle_request(request)
+            writer.write((json.dumps(response) + '\n').encode())
+            await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.ensure_future(answer(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def serve_unix(self, path):
+        """
+        Start a JSON lines server on a Unix socket.
+
+        Args:
+            path: Socket file path (a stale file at that path is replaced)
+
+        Returns:
+            asyncio Server; close it and await wait_closed() to stop serving
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+        return await asyncio.start_unix_server(self.handle_connection, path)
+
+    def close(self):
+        """Shut down the executor if the service created it."""
+        if self.owns_executor:
+            self.executor.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+class SolverClient:
+    """
+    Client of a SolverService running behind a Unix socket.
+
+    Requests can be sent concurrently from many tasks over one connection;
+    responses are matched to requests by id.
+    """
+
+    def __init__(self, reader, writer):
+        """
+        Wrap an open connection; use SolverClient.connect to create one.
+
+        Args:
+            reader: asyncio.StreamReader of the connection
+            writer: asyncio.StreamWriter of the connection
+        """
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.pending = {}  # request id -> future of the response
+        self.receiver = asyncio.ensure_future(self.receive())
+
+    @classmethod
+    async def connect(cls, path):
+        """
+        Connect to a service socket.
+
+        Args:
+            path: Socket file path given to SolverService.serve_unix
+
+        Returns:
+            SolverClient instance
+        """
+        reader, writer = await asyncio.open_unix_connection(path)
+        return cls(reader, writer)
+
+    async def receive(self):
+        """Dispatch response lines to the requests waiting for them."""
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self.pending.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Service connection closed"))
+            self.pending.clear()
+
+    async def request(self, request):
+        """
+        Send one request and wait for its response.
+
+        Args:
+            request: JSON-serialisable request dictionary (its id is assigned here)
+
+        Returns:
+            Response dictionary
+        """
+        self.next_id += 1
+        request = dict(request, id=self.next_id)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[self.next_id] = future
+        self.writer.write((json.dumps(request) + '\n').encode())
+        await self.writer.drain()
+        return await future
+
+    async def solve(self, puzzle_type, start_state, goal_state, algorithm=None):
+        """
+        Solve a puzzle instance on the service.
+
+        Args:
+            puzzle_type: Puzzle type from puzzle_batch.PUZZLES
+            start_state: Sequence of tiles of the start state
+            goal_state: Sequence of tiles of the goal state
+            algorithm: Algorithm name, or None for the service default
+
+        Returns:
+            Response dictionary: the result fields, or 'error' with a message
+        """
+        request = {'puzzle': puzzle_type, 'start': list(start_state), 'goal': list(goal_state)}
+        if algorithm is not None:
+            request['algorithm'] = algorithm
+        return await self.request(request)
+
+    async def stats(self):
+        """
+        Fetch the service counters.
+
+        Returns:
+            Dictionary of counters (see SolverService.stats)
+        """
+        return (await self.request({'stats': True}))['stats']
+
+    async def close(self):
+        """Close the connection."""
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.receiver.cancel()
+
+
+async def serve(path, workers=None, cache_bytes=DEFAULT_CACHE_BYTES):
+    """
+    Run a service on a Unix socket until cancelled.
+
+    Args:
+        path: Socket file path
+        workers: Number of worker processes (defaults to the CPU count)
+        cache_bytes: Size budget of the result cache
+    """
+    async with SolverService(workers=workers, cache_bytes=cache_bytes) as service:
+        server = await service.serve_unix(path)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    """
+    Command line entry point of the solver service.
+
+    Example:
+        python puzzle_service.py --socket /tmp/puzzle.sock --workers 4
+        echo '{"id": 1, "puzzle": "eight", "start": [8,6,7,2,5,4,3,0,1],
+               "goal": [1,2,3,4,5,6,7,8,0]}' | nc -U /tmp/puzzle.sock
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="Serve sliding puzzle solves over a Unix socket.")
+    parser.add_argument('--socket', default='puzzle.sock', help="socket file path (default: puzzle.sock)")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="worker processes, 0 for one per CPU (default: 0)")
+    parser.add_argument('--cache-bytes', type=int, default=DEFAULT_CACHE_BYTES,
+                        help=f"result cache budget in bytes (default: {DEFAULT_CACHE_BYTES})")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.socket, args.workers or None, args.cache_bytes))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()  # Run the service when script is executed directly
@@ -0,0 +1,326 @@
+# Distance tables for the sliding puzzles
+# Shared by FivePuzzle (Sava_1_1.py) and EightPuzzle (Sava_1_2.py)
+
+import mmap    # For sharing table files between processes
+import os      # For building table file paths
+import struct  # For the binary table header
+import zlib    # For the table checksum
+
+UNREACHED = 0xFF  # Table entry of a state that cannot reach the goal
+MAX_TABLE_CELLS = 9  # Largest board with a table; 4x4 would need 16! entries
+
+# Table file layout (little endian):
+#   magic, version, rows, cols, number of actions   -> HEADER_FORMAT
+#   action names, one ASCII byte each
+#   goal state, one byte per cell
+#   table length, CRC-32 of the table              -> TRAILER_FORMAT
+#   table, one byte per permutation rank
+TABLE_MAGIC = b'SPDT'
+TABLE_VERSION = 1
+HEADER_FORMAT = '<4sHBBB'
+TRAILER_FORMAT = '<QI'
+
+# Tables already built, keyed by board shape, action order and goal state
+_distance_tables = {}
+
+
+def rank_permutation(state):
+    """
+    Compute the Lehmer-code rank of a permutation.
+
+    The rank is the position of the permutation in lexicographic order, so
+    every arrangement of tiles 0..n-1 maps to a distinct integer in [0, n!).
+
+    Args:
+        state: Tuple of the integers 0..n-1 in any order
+
+    Returns:
+        Integer rank of the permutation
+    """
+    size = len(state)
+    rank = 0
+    for i in range(size):
+        tile = state[i]
+        smaller = 0
+        for j in range(i + 1, size):
+            if state[j] < tile:
+                smaller += 1
+        rank = rank * (size - i) + smaller  # Horner form of sum(smaller * (n-1-i)!)
+    return rank
+
+
+def table_key(puzzle):
+    """
+    Build the cache key identifying the table of a puzzle's goal.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance
+
+    Returns:
+        Tuple (rows, cols, actions, goal_state)
+    """
+    return (puzzle.rows, puzzle.cols, tuple(puzzle.actions), puzzle.goal_state)
+
+
+def build_distance_table(puzzle):
+    """
+    Run a retrograde BFS from the goal over every reachable state.
+
+    The table has one byte per permutation rank. A reached state stores
+    (distance << 2) | move, where move is the index in puzzle.actions of a
+    move that brings the state one step closer to the goal. States that
+    cannot reach the goal keep the value UNREACHED. Distances on the 2x3 and
+    3x3 boards are at most 31, so every entry fits in a byte.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance whose goal state is used
+
+    Returns:
+        Bytearray indexed by permutation rank
+
+    Raises:
+        ValueError: If the board has more than MAX_TABLE_CELLS cells
+    """
+    size = puzzle.rows * puzzle.cols
+    if size > MAX_TABLE_CELLS:
+        raise ValueError(f"No distance table for a {puzzle.rows}x{puzzle.cols} board, "
+                         f"at most {MAX_TABLE_CELLS} cells are supported")
+    count = 1
+    for i in range(2, size + 1):
+        count *= i
+    table = bytearray([UNREACHED]) * count
+
+    # Blank moves per blank position: (new_blank, index of the undoing action)
+    back_moves = []
+    for idx, moves in enumerate(puzzle.packed_moves):
+        back_moves.append([(idx + blank_delta, puzzle.actions.index(puzzle.inverse_actions[action]))
+                           for _, _, blank_delta, action in moves])
+
+    goal = puzzle.goal_state
+    table[rank_permutation(goal)] = 0
+    frontier = [goal]
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for state in frontier:
+            blank = state.index(0)
+            for new_blank, back_move in back_moves[blank]:
+                neighbor = list(state)
+                neighbor[blank], neighbor[new_blank] = neighbor[new_blank], 0
+                neighbor = tuple(neighbor)
+                rank = rank_permutation(neighbor)
+                if table[rank] == UNREACHED:
+                    table[rank] = (distance << 2) | back_move
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return table
+
+
+def get_distance_table(puzzle):
+    """
+    Return the distance table of a puzzle's goal, building it on first use.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance
+
+    Returns:
+        Bytearray as produced by build_distance_table
+    """
+    key = table_key(puzzle)
+    table = _distance_tables.get(key)
+    if table is None:
+        table = build_distance_table(puzzle)
+        _distance_tables[key] = table
+    return table
+
+
+def drop_distance_table(puzzle):
+    """
+    Forget the cached table of a puzzle's goal, e.g. when the goal goes out of use.
+
+    A mapped table is unmapped once the last view of it is released.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance
+    """
+    _distance_tables.pop(table_key(puzzle), None)
+
+
+def table_distance(puzzle, state, table=None):
+    """
+    Look up the optimal number of moves from a state to the goal.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance
+        state: Tuple representing puzzle state
+        table: Distance table of the puzzle's goal (looked up if omitted)
+
+    Returns:
+        Integer distance, or None if the goal cannot be reached
+    """
+    if table is None:
+        table = get_distance_table(puzzle)
+    entry = table[rank_permutation(state)]
+    if entry == UNREACHED:
+        return None
+    return entry >> 2
+
+
+def table_solve(puzzle, table=None):
+    """
+    Extract an optimal solution by greedy descent through the distance table.
+
+    Each step applies the stored best move, which always lowers the distance
+    by one, so the work is proportional to the solution depth.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance
+        table: Distance table of the puzzle's goal (looked up if omitted)
+
+    Returns:
+        List of actions to reach goal, or None if no solution exists
+    """
+    if table is None:
+        table = get_distance_table(puzzle)
+    state = puzzle.start_state
+    entry = table[rank_permutation(state)]
+    if entry == UNREACHED:
+        return None
+    path = []
+    while entry >> 2:
+        action = puzzle.actions[entry & 3]
+        path.append(action)
+        state = puzzle.move(state, action)
+        entry = table[rank_permutation(state)]
+    return path
+
+
+def table_path(puzzle, directory):
+    """
+    Build the file name under which a puzzle's goal table is stored.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance
+        directory: Directory holding table files
+
+    Returns:
+        Path string such as directory/3x3-LRUD-123456780.spdt
+    """
+    goal = ''.join('%x' % tile for tile in puzzle.goal_state)
+    name = f"{puzzle.rows}x{puzzle.cols}-{''.join(puzzle.actions)}-{goal}.spdt"
+    return os.path.join(directory, name)
+
+
+def pack_header(puzzle, table):
+    """
+    Build the header bytes written in front of a table.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance
+        table: Distance table of the puzzle's goal
+
+    Returns:
+        Bytes of the header
+    """
+    return (struct.pack(HEADER_FORMAT, TABLE_MAGIC, TABLE_VERSION,
+                        puzzle.rows, puzzle.cols, len(puzzle.actions))
+            + ''.join(puzzle.actions).encode('ascii')
+            + bytes(puzzle.goal_state)
+            + struct.pack(TRAILER_FORMAT, len(table), zlib.crc32(table)))
+
+
+def save_distance_table(puzzle, path, table=None):
+    """
+    Write the distance table of a puzzle's goal to a binary file.
+
+    The file is written under a temporary name and renamed into place, so a
+    process mapping the path never sees a partially written table.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance
+        path: Destination file path
+        table: Distance table to write (looked up if omitted)
+    """
+    if table is None:
+        table = get_distance_table(puzzle)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(pack_header(puzzle, table))
+        f.write(table)
+    os.replace(temp_path, path)
+
+
+def load_distance_table(puzzle, path, verify=False):
+    """
+    Map a saved distance table read-only and register it for the puzzle's goal.
+
+    The table is used straight from the mapping without copying or parsing,
+    so every process mapping the same file shares one page-cache copy.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance the table must belong to
+        path: Table file path
+        verify: If True, also check the table checksum (reads the whole file)
+
+    Returns:
+        Read-only memoryview indexed by permutation rank
+
+    Raises:
+        ValueError: If the file is not a table for this board, action order
+                    and goal, or the checksum does not match
+    """
+    size = puzzle.rows * puzzle.cols
+    expected = pack_header(puzzle, b'')
+    header_size = len(expected)
+    trailer_size = struct.calcsize(TRAILER_FORMAT)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < header_size:
+            raise ValueError(f"{path} is too short to hold a table header")
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    table = None
+    try:
+        # Everything up to the trailer identifies the board, actions and goal
+        if mapping[:header_size - trailer_size] != expected[:-trailer_size]:
+            raise ValueError(f"{path} is not a {puzzle.rows}x{puzzle.cols} table "
+                             f"for goal {puzzle.goal_state}")
+        length, checksum = struct.unpack_from(TRAILER_FORMAT, mapping, header_size - trailer_size)
+        count = 1
+        for i in range(2, size + 1):
+            count *= i
+        if length != count or len(mapping) != header_size + length:
+            raise ValueError(f"{path} has a truncated or oversized table")
+
+        table = memoryview(mapping)[header_size:]
+        if verify and zlib.crc32(table) != checksum:
+            raise ValueError(f"{path} failed the checksum test")
+    except ValueError:
+        # Do not leak the mapping of a rejected file
+        if table is not None:
+            table.release()
+        mapping.close()
+        raise
+    _distance_tables[table_key(puzzle)] = table
+    return table
+
+
+def open_distance_table(puzzle, directory):
+    """
+    Return the goal table from a table directory, building and saving it once.
+
+    Args:
+        puzzle: FivePuzzle or EightPuzzle instance
+        directory: Directory holding table files
+
+    Returns:
+        Read-only memoryview of the mapped table
+    """
+    table = _distance_tables.get(table_key(puzzle))
+    if isinstance(table, memoryview):
+        return table  # Already mapped
+    path = table_path(puzzle, directory)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        save_distance_table(puzzle, path)
+    return load_distance_table(puzzle, path)
@@ -0,0 +1,172 @@
+# Layer-synchronous breadth-first search over whole frontiers with NumPy
+# Optional engine for SlidingPuzzle (sliding_puzzle.py) boards up to 3x3
+
+try:
+    import numpy as np  # Vectorized frontiers, not a hard dependency
+except ImportError:
+    np = None
+
+from puzzle_tables import MAX_TABLE_CELLS, UNREACHED, rank_permutation
+
+
+def require_numpy(puzzle):
+    """
+    Check that the vectorized search can run on a puzzle.
+
+    Args:
+        puzzle: SlidingPuzzle instance
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValueError: If the board has more than MAX_TABLE_CELLS cells
+    """
+    if np is None:
+        raise ImportError("The vectorized BFS needs NumPy, install it with 'pip install numpy'")
+    if puzzle.rows * puzzle.cols > MAX_TABLE_CELLS:
+        raise ValueError(f"No vectorized BFS for a {puzzle.rows}x{puzzle.cols} board, "
+                         f"at most {MAX_TABLE_CELLS} cells are supported")
+
+
+def rank_codes(puzzle, codes):
+    """
+    Compute the Lehmer-code rank of every packed state of an array.
+
+    Vectorized form of puzzle_tables.rank_permutation: the tiles are read
+    out of the codes one cell at a time and the smaller-tile counts are
+    summed with array comparisons.
+
+    Args:
+        puzzle: SlidingPuzzle instance
+        codes: int64 array of packed states (see SlidingPuzzle.encode)
+
+    Returns:
+        int64 array of permutation ranks
+    """
+    size = puzzle.rows * puzzle.cols
+    bits, mask = puzzle.cell_bits, puzzle.cell_mask
+    tiles = [(codes >> (bits * (size - i))) & mask for i in range(size)]
+    ranks = np.zeros(len(codes), dtype=np.int64)
+    for i in range(size - 1):
+        smaller = np.zeros(len(codes), dtype=np.int64)
+        for j in range(i + 1, size):
+            smaller += tiles[j] < tiles[i]
+        ranks = ranks * (size - i) + smaller
+    return ranks
+
+
+def expand_layer(puzzle, frontier):
+    """
+    Apply every legal blank move to every state of a frontier.
+
+    States are grouped by blank position, then each move of that position
+    is one shift-and-add over the whole group (see get_packed_neighbors).
+
+    Args:
+        puzzle: SlidingPuzzle instance
+        frontier: int64 array of packed states
+
+    Returns:
+        int64 array of all neighbor states, duplicates included
+    """
+    mask = puzzle.cell_mask
+    blanks = frontier & mask
+    children = []
+    for idx, moves in enumerate(puzzle.packed_moves):
+        group = frontier[blanks == idx]
+        if not len(group):
+            continue
+        for shift_from, shift_to, blank_delta, _ in moves:
+            tiles = (group >> shift_from) & mask
+            children.append(group - (tiles << shift_from) + (tiles << shift_to) + blank_delta)
+    if not children:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(children)
+
+
+def bfs_layers(puzzle, source, target=None, stats=None):
+    """
+    Run a layer-at-a-time BFS from a state, recording distances by rank.
+
+    Each layer is expanded in one go by expand_layer. The children are
+    ranked, those already reached are dropped with a lookup in the distance
+    array (which doubles as the visited bitmap) and the rest are made
+    unique with np.unique before forming the next frontier.
+
+    Args:
+        puzzle: SlidingPuzzle instance
+        source: Tuple representing the state the search starts from
+        target: Optional tuple; the search stops after the layer reaching it
+        stats: Optional SearchStats to add the search counters to
+
+    Returns:
+        uint8 array of BFS distances indexed by permutation rank, UNREACHED
+        for states that were not reached
+    """
+    require_numpy(puzzle)
+    size = puzzle.rows * puzzle.cols
+    count = 1
+    for i in range(2, size + 1):
+        count *= i
+    distances = np.full(count, UNREACHED, dtype=np.uint8)
+    distances[rank_permutation(source)] = 0
+    target_rank = rank_permutation(target) if target is not None else None
+
+    frontier = np.array([puzzle.encode(source)], dtype=np.int64)
+    expanded = generated = duplicates = 0
+    peak_frontier = reached = 1
+    depth = 0
+    while len(frontier) and (target_rank is None or distances[target_rank] == UNREACHED):
+        depth += 1
+        expanded += len(frontier)
+        children = expand_layer(puzzle, frontier)
+        ranks = rank_codes(puzzle, children)
+        fresh = distances[ranks] == UNREACHED
+        ranks, first = np.unique(ranks[fresh], return_index=True)
+        frontier = children[fresh][first]
+        distances[ranks] = depth
+
+        generated += len(children)
+        duplicates += len(children) - len(frontier)
+        reached += len(frontier)
+        peak_frontier = max(peak_frontier, len(frontier))
+
+    if stats is not None:
+        stats.nodes_expanded += expanded
+        stats.nodes_generated += generated
+        stats.duplicates += duplicates
+        stats.peak_frontier = max(stats.peak_frontier, peak_frontier)
+        stats.peak_visited = max(stats.peak_visited, reached)
+    return distances
+
+
+def vector_solve(puzzle, stats=None):
+    """
+    Find a shortest solution with the layer-synchronous BFS.
+
+    The search runs forward from the start state until the layer holding
+    the goal is complete; the path is then rebuilt backwards from the goal
+    by stepping to any neighbor one layer closer to the start, so no parent
+    links are stored.
+
+    Args:
+        puzzle: SlidingPuzzle instance
+        stats: Optional SearchStats to add the search counters to
+
+    Returns:
+        List of actions to reach goal, or None if no solution exists
+    """
+    distances = bfs_layers(puzzle, puzzle.start_state, puzzle.goal_state, stats)
+    state = puzzle.goal_state
+    depth = int(distances[rank_permutation(state)])
+    if depth == UNREACHED:
+        return None
+    path = []
+    while depth:
+        for neighbor, action in puzzle.get_neighbors(state):
+            if distances[rank_permutation(neighbor)] == depth - 1:
+                path.append(puzzle.inverse_actions[action])
+                state = neighbor
+                depth -= 1
+                break
+    path.reverse()
+    return path
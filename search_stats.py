@@ -0,0 +1,152 @@
+# Search statistics for the sliding puzzle solvers
+# Filled in by FivePuzzle (Sava_1_1.py) and EightPuzzle (Sava_1_2.py) searches
+
+import time  # For timing searches and heuristic calls
+
+class SearchStats:
+    """
+    Counters describing one search run.
+
+    Every search method creates (or receives) a SearchStats object, fills it
+    in and attaches it to the puzzle as puzzle.stats. The basic counters are
+    always collected. Per-depth histograms, the expansion hook and heuristic
+    timing are opt-in, because they add work to every expanded node.
+
+    Attributes:
+        nodes_expanded: States whose neighbors were generated
+        nodes_generated: Neighbor states produced by expansions
+        duplicates: Generated states rejected as already seen (or on the path)
+        peak_frontier: Largest size of the open list / queue / DFS stack
+        peak_visited: Largest number of states remembered as seen
+        heuristic_time: Seconds spent computing h (only with time_heuristic)
+        solution_depth: Length of the solution found, or None
+        elapsed_time: Wall time of the whole search in seconds
+        depth_histogram: Dictionary depth -> expanded states (only with histogram)
+        suboptimality_bound: Proven ratio of the solution length to the optimal
+                             one, set by the bounded-suboptimal searches (else None)
+    """
+
+    def __init__(self, histogram=False, hook=None, time_heuristic=False):
+        """
+        Create empty statistics.
+
+        Args:
+            histogram: If True, count expanded states per depth
+            hook: Optional callback hook(state, depth, stats) run on every expansion
+            time_heuristic: If True, measure the time spent in heuristic calls
+        """
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.duplicates = 0
+        self.peak_frontier = 0
+        self.peak_visited = 0
+        self.heuristic_time = 0.0
+        self.solution_depth = None
+        self.elapsed_time = 0.0
+        self.suboptimality_bound = None
+        self.depth_histogram = {} if histogram else None
+        self.hook = hook
+        self.time_heuristic = time_heuristic
+        self.started_at = None
+
+    def start(self):
+        """Start the wall clock of the search."""
+        self.started_at = time.perf_counter()
+
+    def finish(self, path):
+        """
+        Stop the wall clock and record the solution depth.
+
+        Args:
+            path: List of actions found by the search, or None
+
+        Returns:
+            The path, so searches can end with return stats.finish(path)
+        """
+        self.elapsed_time = time.perf_counter() - self.started_at
+        self.solution_depth = len(path) if path is not None else None
+        return path
+
+    @property
+    def profiling(self):
+        """True when record_expansion has any work to do."""
+        return self.depth_histogram is not None or self.hook is not None
+
+    def record_expansion(self, state, depth):
+        """
+        Feed the per-depth histogram and the hook with one expanded state.
+
+        Searches only call this when profiling is True.
+
+        Args:
+            state: State being expanded (in the representation the search uses)
+            depth: Number of moves from the start state to state
+        """
+        if self.depth_histogram is not None:
+            self.depth_histogram[depth] = self.depth_histogram.get(depth, 0) + 1
+        if self.hook is not None:
+            self.hook(state, depth, self)
+
+    @property
+    def effective_branching_factor(self):
+        """
+        Branching factor b* of a uniform tree of the solution depth that holds
+        as many nodes as the search generated: N + 1 = 1 + b* + ... + b*^d.
+        None when no solution (or an empty one) was found.
+        """
+        depth = self.solution_depth
+        if not depth:
+            return None
+        total = self.nodes_generated + 1
+        # b*^d alone reaches N + 1 at b* = (N + 1)^(1/d), so no power below
+        # that bound can overflow however deep the search went
+        low, high = 0.0, max(1.0, total ** (1.0 / depth))
+        for _ in range(100):  # Bisection, tree size grows with b
+            middle = (low + high) / 2
+            size = sum(middle ** i for i in range(depth + 1))
+            if size < total:
+                low = middle
+            else:
+                high = middle
+        return (low + high) / 2
+
+    @property
+    def nodes_per_second(self):
+        """Expanded states per second of wall time, or None if nothing was timed."""
+        if self.elapsed_time <= 0:
+            return None
+        return self.nodes_expanded / self.elapsed_time
+
+    def as_dict(self):
+        """
+        Collect the statistics into a dictionary, e.g. for JSON output.
+
+        Returns:
+            Dictionary of counters and derived values
+        """
+        result = {
+            'nodes_expanded': self.nodes_expanded,
+            'nodes_generated': self.nodes_generated,
+            'duplicates': self.duplicates,
+            'peak_frontier': self.peak_frontier,
+            'peak_visited': self.peak_visited,
+            'heuristic_time': self.heuristic_time,
+            'solution_depth': self.solution_depth,
+            'elapsed_time': self.elapsed_time,
+            'effective_branching_factor': self.effective_branching_factor,
+        }
+        if self.suboptimality_bound is not None:
+            result['suboptimality_bound'] = self.suboptimality_bound
+        if self.depth_histogram is not None:
+            result['depth_histogram'] = dict(sorted(self.depth_histogram.items()))
+        return result
+
+    def __str__(self):
+        branching = self.effective_branching_factor
+        text = (f"expanded={self.nodes_expanded} generated={self.nodes_generated} "
+                f"duplicates={self.duplicates} peak_frontier={self.peak_frontier} "
+                f"peak_visited={self.peak_visited} heuristic_time={self.heuristic_time:.6f} "
+                f"b*={'n/a' if branching is None else f'{branching:.3f}'}")
+        if self.suboptimality_bound is not None:
+            text += f" bound={self.suboptimality_bound:.3f}"
+        return text
@@ -0,0 +1,984 @@
+# Sliding puzzle core for boards of any shape
+# Shared by FivePuzzle (Sava_1_1.py), EightPuzzle (Sava_1_2.py) and larger boards
+
+import timeit  # For measuring heuristic time
+from collections import deque  # For the multi-start BFS queue
+import pattern_db  # Additive pattern databases
+import puzzle_tables  # Shared distance tables
+import puzzle_vector  # Optional NumPy layer-synchronous BFS
+from search_stats import SearchStats  # For search instrumentation
+
+# Cell offset (row, col) of the tile that slides into the blank for each action:
+# 'U' takes the tile below, 'D' the tile above, 'L' the tile to the right and
+# 'R' the tile to the left
+ACTION_OFFSETS = {'U': (1, 0), 'D': (-1, 0), 'L': (0, 1), 'R': (0, -1)}
+INVERSE_ACTIONS = {'U': 'D', 'D': 'U', 'L': 'R', 'R': 'L'}
+
+# Move tables already built, keyed by board shape and action order
+_move_tables = {}
+
+# Linear conflict tables already built, keyed by line length
+_conflict_tables = {}
+
+
+def build_move_tables(rows, cols, actions):
+    """
+    Precompute the legal moves of every blank position of a board shape.
+
+    Tables only depend on the shape and the action order, so they are built
+    once and shared by every puzzle of that shape.
+
+    Args:
+        rows: Number of rows of the board
+        cols: Number of columns of the board
+        actions: Action names in the order neighbors are generated
+
+    Returns:
+        Tuple (blank_moves, packed_moves). blank_moves[idx] lists the
+        (new_idx, action) pairs of a blank at idx, where new_idx is the cell
+        of the tile sliding into it. packed_moves[idx] lists the matching
+        (shift_from, shift_to, blank_delta, action) entries for packed states
+        (see SlidingPuzzle.encode).
+    """
+    key = (rows, cols, tuple(actions))
+    tables = _move_tables.get(key)
+    if tables is not None:
+        return tables
+
+    size = rows * cols
+    bits = cell_bits(size)
+    blank_moves = []
+    packed_moves = []
+    for idx in range(size):
+        row, col = divmod(idx, cols)
+        moves = []
+        packed = []
+        for action in actions:
+            row_offset, col_offset = ACTION_OFFSETS[action]
+            new_row, new_col = row + row_offset, col + col_offset
+            if not (0 <= new_row < rows and 0 <= new_col < cols):
+                continue  # Move leaves the board
+            new_idx = new_row * cols + new_col
+            moves.append((new_idx, action))
+            packed.append((bits * (size - new_idx), bits * (size - idx), new_idx - idx, action))
+        blank_moves.append(moves)
+        packed_moves.append(packed)
+
+    tables = (blank_moves, packed_moves)
+    _move_tables[key] = tables
+    return tables
+
+
+def cell_bits(size):
+    """
+    Number of bits a cell takes in a packed state.
+
+    Args:
+        size: Number of cells on the board
+
+    Returns:
+        4 for boards of up to 16 cells, enough bits for the largest tile otherwise
+    """
+    return max(4, (size - 1).bit_length())
+
+
+def longest_increasing_run(values):
+    """
+    Length of the longest strictly increasing subsequence of a short list.
+
+    Args:
+        values: List of distinct integers
+
+    Returns:
+        Integer length, 0 for an empty list
+    """
+    best = []  # best[k] is the smallest tail of an increasing run of length k + 1
+    for value in values:
+        for k, tail in enumerate(best):
+            if value < tail:
+                best[k] = value
+                break
+        else:
+            best.append(value)
+    return len(best)
+
+
+def build_conflict_table(length):
+    """
+    Precompute the linear conflict penalty of every pattern of a board line.
+
+    A line pattern records, for each cell of a row (or column) of the given
+    length, the goal position along the line plus 1 of the tile there when
+    the tile belongs to this line in the goal, and 0 otherwise (other tiles
+    and the blank). Read as a number in base length + 1 with the first cell
+    most significant, it indexes the table. Tables only depend on the line
+    length, so they are built once and shared by every row or column of
+    that length.
+
+    Args:
+        length: Number of cells of the line
+
+    Returns:
+        Bytearray mapping each pattern to 2 moves per tile outside the
+        longest run already in goal order
+    """
+    table = _conflict_tables.get(length)
+    if table is not None:
+        return table
+    base = length + 1
+    table = bytearray(base ** length)
+    for key in range(len(table)):
+        digits = []
+        rest = key
+        for _ in range(length):
+            rest, digit = divmod(rest, base)
+            digits.append(digit)
+        digits.reverse()  # First cell first
+        line = [digit - 1 for digit in digits if digit]
+        if len(set(line)) == len(line):  # Patterns repeating a goal position never occur
+            table[key] = 2 * (len(line) - longest_increasing_run(line))
+    _conflict_tables[length] = table
+    return table
+
+
+def max_heuristic(*heuristics):
+    """
+    Combine admissible heuristics into their maximum, which is admissible too.
+
+    Heuristics are evaluated in the given order, so list the cheap ones
+    first. The combined function has a bounded(state, limit) variant that
+    stops as soon as one heuristic exceeds limit: IDA* uses it with the
+    remaining cost bound, since any value above it prunes the state no
+    matter what the later heuristics would return.
+
+    Args:
+        heuristics: Functions mapping a state tuple to a lower bound on the moves to the goal
+
+    Returns:
+        Function state -> max of the heuristics, with a bounded attribute
+    """
+    def combined(state):
+        best = 0
+        for heuristic in heuristics:
+            value = heuristic(state)
+            if value > best:
+                best = value
+        return best
+
+    def bounded(state, limit):
+        best = 0
+        for heuristic in heuristics:
+            value = heuristic(state)
+            if value > best:
+                best = value
+                if best > limit:
+                    break  # Already prunes the state, skip the costlier heuristics
+        return best
+
+    combined.bounded = bounded
+    combined.__name__ = 'max_' + '_'.join(heuristic.__name__ for heuristic in heuristics)
+    return combined
+
+
+class SlidingPuzzle:
+    """
+    Sliding puzzle on a rows x cols board with tiles 1 to rows*cols - 1 and a blank (0).
+
+    Holds everything that only depends on the board shape: moves, the
+    solvability test, packed states, the per-goal heuristic tables and
+    IDA*. FivePuzzle and EightPuzzle are thin subclasses that fix the
+    shape and the action order and add their own searches.
+    """
+
+    def __init__(self, start_state, goal_state, rows, cols, actions=('L', 'R', 'U', 'D')):
+        """
+        Initialize the puzzle with start and goal states.
+
+        Args:
+            start_state: List of rows*cols integers representing the initial configuration
+            goal_state: List of rows*cols integers representing the target configuration
+            rows: Number of rows of the board
+            cols: Number of columns of the board
+            actions: Action names in the order neighbors are generated
+
+        Raises:
+            ValueError: If a state is not each number from 0 to rows*cols - 1 exactly once
+        """
+        self.rows = rows
+        self.cols = cols
+        self.actions = list(actions)
+        self.inverse_actions = {action: INVERSE_ACTIONS[action] for action in self.actions}
+        self.cell_bits = cell_bits(rows * cols)  # Bits per cell in packed states
+        self.cell_mask = (1 << self.cell_bits) - 1
+        self.blank_moves, self.packed_moves = build_move_tables(rows, cols, self.actions)
+        self.start_state = self.validate_state(start_state)
+        self.goal_state = self.validate_state(goal_state)
+        self.solvable = self.is_solvable()  # Whether goal is reachable from start
+        self.build_heuristic_tables()  # Per-goal heuristic lookup tables
+        self.stats = SearchStats()  # Statistics of the last search
+
+    def validate_state(self, state):
+        """
+        Check that a state fits the board.
+
+        Args:
+            state: List or tuple of tiles
+
+        Returns:
+            The state as a tuple
+
+        Raises:
+            ValueError: If the state is not each number from 0 to rows*cols - 1 exactly once
+        """
+        size = self.rows * self.cols
+        state = tuple(state)
+        if sorted(state) != list(range(size)):
+            raise ValueError(f"A {self.rows}x{self.cols} state must use each number "
+                             f"from 0 to {size - 1} exactly once, got {state}")
+        return state
+
+    def get_blank_position(self, state):
+        """
+        Get the index of the blank tile (0) in the state.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            Integer index of the blank tile
+        """
+        return state.index(0)
+
+    def is_goal(self, state):
+        """
+        Check if the current state matches the goal state.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            True if goal is reached, False otherwise
+        """
+        return state == self.goal_state
+
+    def move(self, state, action):
+        """
+        Generate a new state by moving a tile into the blank space.
+
+        Actions describe where the tile comes from:
+        - 'U': Move tile from below into blank
+        - 'D': Move tile from above into blank
+        - 'L': Move tile from right into blank
+        - 'R': Move tile from left into blank
+
+        Args:
+            state: Current puzzle state as tuple
+            action: Direction of the move ('U', 'D', 'L', 'R')
+
+        Returns:
+            New state as a tuple or None if move is invalid
+        """
+        idx = self.get_blank_position(state)
+        for new_idx, move_action in self.blank_moves[idx]:
+            if move_action == action:
+                state = list(state)
+                state[idx], state[new_idx] = state[new_idx], 0
+                return tuple(state)
+        return None  # Invalid move
+
+    def get_neighbors(self, state):
+        """
+        Generate all valid neighboring states from the current state.
+
+        Args:
+            state: Tuple representing current puzzle state
+
+        Returns:
+            List of (new_state, action) pairs, in the order of self.actions
+        """
+        idx = state.index(0)
+        neighbors = []
+        for new_idx, action in self.blank_moves[idx]:
+            new_state = list(state)
+            new_state[idx], new_state[new_idx] = new_state[new_idx], 0
+            neighbors.append((tuple(new_state), action))
+        return neighbors
+
+    def set_start_state(self, start_state):
+        """
+        Replace the start state and refresh the solvability check.
+
+        Args:
+            start_state: List or tuple of tiles for the new initial configuration
+        """
+        self.start_state = self.validate_state(start_state)
+        self.solvable = self.is_solvable()
+
+    def set_goal_state(self, goal_state):
+        """
+        Replace the goal state, refresh the solvability check and rebuild
+        the heuristic tables for the new goal.
+
+        Args:
+            goal_state: List or tuple of tiles for the new target configuration
+        """
+        self.goal_state = self.validate_state(goal_state)
+        self.solvable = self.is_solvable()
+        self.build_heuristic_tables()
+
+    def count_inversions(self, state):
+        """
+        Count pairs of tiles that appear in reverse order, ignoring the blank.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            Integer number of inversions
+        """
+        tiles = [tile for tile in state if tile != 0]
+        inversions = 0
+        for i in range(len(tiles)):
+            for j in range(i + 1, len(tiles)):
+                if tiles[i] > tiles[j]:
+                    inversions += 1
+        return inversions
+
+    def is_solvable(self):
+        """
+        Check whether the goal state can be reached from the start state.
+
+        Every move changes the inversion count by an amount whose parity is fixed
+        by the board width: a horizontal move never changes it, a vertical move
+        jumps over cols - 1 tiles. On odd-width boards the inversion parity is
+        therefore invariant; on even-width boards the inversion parity plus the
+        blank row is. Start and goal are reachable from each other exactly when
+        these invariants agree, which holds for any goal state.
+
+        Returns:
+            True if a solution exists, False otherwise
+        """
+        return self.parity(self.start_state) == self.parity(self.goal_state)
+
+    def parity(self, state):
+        """
+        Compute the move invariant used by is_solvable.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            0 or 1; states with equal values are reachable from each other
+        """
+        parity = self.count_inversions(state)
+        if self.cols % 2 == 0:
+            parity += state.index(0) // self.cols  # Even width: blank row matters too
+        return parity % 2
+
+    def encode(self, state):
+        """
+        Pack a state into a single integer.
+
+        Every cell takes self.cell_bits bits (4 up to the 15-puzzle, 5 for the
+        24-puzzle), with cell 0 in the most significant position so that
+        packed states order the same way as their tuples. The lowest
+        self.cell_bits bits hold the index of the blank tile.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            Integer encoding of the state
+        """
+        bits = self.cell_bits
+        code = 0
+        for tile in state:
+            code = (code << bits) | tile
+        return (code << bits) | state.index(0)
+
+    def decode(self, code):
+        """
+        Unpack an integer produced by encode back into a state tuple.
+
+        Args:
+            code: Integer encoding of a puzzle state
+
+        Returns:
+            Tuple representing puzzle state
+        """
+        bits, mask = self.cell_bits, self.cell_mask
+        code >>= bits  # Drop the blank position
+        state = []
+        for _ in range(self.rows * self.cols):
+            state.append(code & mask)
+            code >>= bits
+        state.reverse()
+        return tuple(state)
+
+    def get_packed_neighbors(self, code):
+        """
+        Generate all valid neighboring states of a packed state.
+
+        Args:
+            code: Integer encoding of the current puzzle state
+
+        Returns:
+            List of (new_code, action) pairs
+        """
+        mask = self.cell_mask
+        neighbors = []
+        for shift_from, shift_to, blank_delta, action in self.packed_moves[code & mask]:
+            tile = (code >> shift_from) & mask
+            neighbors.append((code - (tile << shift_from) + (tile << shift_to) + blank_delta, action))
+        return neighbors
+
+    def build_heuristic_tables(self):
+        """
+        Precompute per-tile heuristic costs for the current goal state.
+
+        md_table[tile][pos] is the Manhattan distance of tile at pos from its
+        goal position and oop_table[tile][pos] is 1 when tile at pos is out of
+        place. Rows for the blank tile are all zero. Both heuristics become a
+        sum of lookups, and a move changes only the row of the moved tile.
+        Pattern databases of the previous goal are dropped.
+        """
+        size = self.rows * self.cols
+        self.md_table = []
+        self.oop_table = []
+        self.goal_positions = []  # (row, col) of every tile in the goal
+        for tile in range(size):
+            goal_idx = self.goal_state.index(tile)
+            goal_row, goal_col = divmod(goal_idx, self.cols)
+            self.goal_positions.append((goal_row, goal_col))
+            md_row = []
+            oop_row = []
+            for pos in range(size):
+                row, col = divmod(pos, self.cols)
+                if tile == 0:
+                    md_row.append(0)  # Blank tile never counts
+                    oop_row.append(0)
+                else:
+                    md_row.append(abs(row - goal_row) + abs(col - goal_col))
+                    oop_row.append(int(pos != goal_idx))
+            self.md_table.append(md_row)
+            self.oop_table.append(oop_row)
+        self.build_conflict_keys()
+        self.pattern_databases = None  # Built on first use of pattern_database
+
+    def build_conflict_keys(self):
+        """
+        Precompute what every tile adds to the line pattern keys of linear_conflict.
+
+        row_conflict_keys[tile][pos] is the contribution of tile at pos to the
+        key of its row in row_conflicts (see build_conflict_table), and 0
+        when the goal of the tile is in another row; col_conflict_keys does
+        the same for columns. The key of a line is then the sum of the
+        entries of the tiles on it.
+        """
+        rows, cols = self.rows, self.cols
+        self.row_conflicts = build_conflict_table(cols)
+        self.col_conflicts = build_conflict_table(rows)
+        self.row_conflict_keys = []
+        self.col_conflict_keys = []
+        for tile in range(rows * cols):
+            goal_row, goal_col = self.goal_positions[tile]
+            row_keys = []
+            col_keys = []
+            for pos in range(rows * cols):
+                row, col = divmod(pos, cols)
+                if tile != 0 and row == goal_row:
+                    row_keys.append((goal_col + 1) * (cols + 1) ** (cols - 1 - col))
+                else:
+                    row_keys.append(0)
+                if tile != 0 and col == goal_col:
+                    col_keys.append((goal_row + 1) * (rows + 1) ** (rows - 1 - row))
+                else:
+                    col_keys.append(0)
+            self.row_conflict_keys.append(row_keys)
+            self.col_conflict_keys.append(col_keys)
+
+    def manhattan_distance(self, state):
+        """
+        Calculate the Manhattan distance heuristic.
+
+        Sum of the horizontal and vertical distances of every tile from its
+        goal position. Admissible, since a move shifts one tile by one cell.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            Integer sum of Manhattan distances for all tiles
+        """
+        table = self.md_table
+        distance = 0
+        for i, tile in enumerate(state):
+            distance += table[tile][i]
+        return distance
+
+    def out_of_place(self, state):
+        """
+        Calculate the out-of-place heuristic.
+
+        Counts the tiles that are not in their goal positions. Admissible but
+        less informed than the Manhattan distance.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            Integer number of tiles in wrong positions (excluding blank)
+        """
+        table = self.oop_table
+        count = 0
+        for i, tile in enumerate(state):
+            count += table[tile][i]
+        return count
+
+    def linear_conflict(self, state):
+        """
+        Calculate the Manhattan distance plus linear conflicts.
+
+        Tiles that sit in their goal row (or column) but in the wrong order
+        must step out of the line to pass each other. In every line, all
+        tiles outside a longest run already in goal order need at least two
+        moves on top of their Manhattan distance. The penalty of each line
+        is looked up in a precomputed table keyed by the line pattern (see
+        build_conflict_table), so a call costs one pass over the board plus
+        one lookup per row and column. Admissible and never below the
+        Manhattan distance.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            Integer lower bound on the moves to the goal
+        """
+        cols = self.cols
+        md_table = self.md_table
+        row_keys_table = self.row_conflict_keys
+        col_keys_table = self.col_conflict_keys
+        row_keys = [0] * self.rows
+        col_keys = [0] * cols
+        distance = 0
+        for pos, tile in enumerate(state):
+            distance += md_table[tile][pos]
+            row_keys[pos // cols] += row_keys_table[tile][pos]
+            col_keys[pos % cols] += col_keys_table[tile][pos]
+        row_conflicts = self.row_conflicts
+        col_conflicts = self.col_conflicts
+        for key in row_keys:
+            distance += row_conflicts[key]
+        for key in col_keys:
+            distance += col_conflicts[key]
+        return distance
+
+    def pattern_database(self, state):
+        """
+        Calculate the additive pattern database heuristic.
+
+        The tiles are split into disjoint patterns (see
+        pattern_db.default_patterns) whose exact placement costs are looked
+        up and added. The databases of a goal are built on first use and
+        shared by every puzzle with that goal.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            Integer lower bound on the moves to the goal
+        """
+        if self.pattern_databases is None:
+            self.pattern_databases = pattern_db.get_pattern_databases(self)
+        return pattern_db.pattern_distance(self.pattern_databases, state, self.rows * self.cols)
+
+    def pattern_database_lc(self, state):
+        """
+        Calculate the larger of the pattern database and linear conflict heuristics.
+
+        Args:
+            state: Tuple representing puzzle state
+
+        Returns:
+            Integer lower bound on the moves to the goal
+        """
+        return max(self.pattern_database(state), self.linear_conflict(state))
+
+    def get_heuristic_table(self, heuristic_func):
+        """
+        Find the per-tile table behind one of the built-in heuristics.
+
+        Searches use the table to update h incrementally: when a tile slides
+        from new_idx into the blank at idx, h changes by
+        table[tile][idx] - table[tile][new_idx].
+
+        Args:
+            heuristic_func: Heuristic passed to a search method
+
+        Returns:
+            The matching table, or None for heuristics without one
+        """
+        if heuristic_func == self.manhattan_distance:
+            return self.md_table
+        if heuristic_func == self.out_of_place:
+            return self.oop_table
+        return None
+
+    def reconstruct_path(self, parents, state):
+        """
+        Rebuild the sequence of actions leading from the start state to a state.
+
+        Args:
+            parents: Dictionary mapping each reached state to (parent_state, action),
+                     with the start state mapped to None
+            state: State whose path should be rebuilt
+
+        Returns:
+            List of actions from the start state to the given state
+        """
+        path = []
+        link = parents[state]
+        while link is not None:
+            state, action = link
+            path.append(action)
+            link = parents[state]
+        path.reverse()
+        return path
+
+    def join_paths(self, forward_parents, backward_parents, meeting_state):
+        """
+        Combine the two halves of a bidirectional search into one path.
+
+        Args:
+            forward_parents: Parent links of the search started at the start state
+            backward_parents: Parent links of the search started at the goal state
+            meeting_state: State reached by both searches
+
+        Returns:
+            List of actions from the start state to the goal state
+        """
+        path = self.reconstruct_path(forward_parents, meeting_state)
+        link = backward_parents[meeting_state]
+        while link is not None:
+            # The backward search moved from state to the current one,
+            # so the inverse action leads back towards the goal
+            state, action = link
+            path.append(self.inverse_actions[action])
+            link = backward_parents[state]
+        return path
+
+    def ida_star(self, heuristic_func, stats=None):
+        """
+        Implement Iterative Deepening A* (IDA*) to find an optimal solution.
+
+        Runs depth-first searches bounded by f(n) = g(n) + h(n), raising the
+        bound to the smallest f that exceeded it until the goal is found. The
+        board is changed in place and only the current path is stored, so
+        memory grows with the solution depth instead of the number of states.
+        Moves that undo the previous move are never tried. The Manhattan,
+        out-of-place and linear conflict heuristics are updated per move
+        instead of recomputed; heuristics combined with max_heuristic are
+        evaluated only until the state is known to exceed the bound.
+
+        Args:
+            heuristic_func: Function to calculate heuristic value (h(n)),
+                            must be admissible for the result to be optimal
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats. Counters add up
+                   over all iterations.
+
+        Returns:
+            List of actions leading to goal, or None if no solution exists
+        """
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        if not self.solvable:
+            return stats.finish(None)  # Goal is unreachable, skip the search
+
+        blank_moves = self.blank_moves
+        inverse = self.inverse_actions
+        h_table = self.get_heuristic_table(heuristic_func)
+        bounded = getattr(heuristic_func, 'bounded', None)  # See max_heuristic
+        board = list(self.start_state)
+        incremental_lc = heuristic_func == self.linear_conflict
+        if incremental_lc:
+            # Keep the line pattern keys of the board up to date, so a move
+            # only looks up the rows and columns it touches
+            cols = self.cols
+            md_table = self.md_table
+            row_key_table, col_key_table = self.row_conflict_keys, self.col_conflict_keys
+            row_conflicts, col_conflicts = self.row_conflicts, self.col_conflicts
+            row_keys = [0] * self.rows
+            col_keys = [0] * cols
+            for pos, tile in enumerate(board):
+                row_keys[pos // cols] += row_key_table[tile][pos]
+                col_keys[pos % cols] += col_key_table[tile][pos]
+
+            def shift_tile(tile, src, dst):
+                # Move tile from cell src to cell dst in the line keys,
+                # returning the change of the conflict penalty
+                row_src, col_src = divmod(src, cols)
+                row_dst, col_dst = divmod(dst, cols)
+                tile_row_keys, tile_col_keys = row_key_table[tile], col_key_table[tile]
+                if row_src == row_dst:
+                    # Horizontal move: one row changes order, two columns change members
+                    key = row_keys[row_src]
+                    new_key = row_keys[row_src] = key - tile_row_keys[src] + tile_row_keys[dst]
+                    delta = row_conflicts[new_key] - row_conflicts[key]
+                    key = col_keys[col_src]
+                    new_key = col_keys[col_src] = key - tile_col_keys[src]
+                    delta += col_conflicts[new_key] - col_conflicts[key]
+                    key = col_keys[col_dst]
+                    new_key = col_keys[col_dst] = key + tile_col_keys[dst]
+                    return delta + col_conflicts[new_key] - col_conflicts[key]
+                # Vertical move: one column changes order, two rows change members
+                key = col_keys[col_src]
+                new_key = col_keys[col_src] = key - tile_col_keys[src] + tile_col_keys[dst]
+                delta = col_conflicts[new_key] - col_conflicts[key]
+                key = row_keys[row_src]
+                new_key = row_keys[row_src] = key - tile_row_keys[src]
+                delta += row_conflicts[new_key] - row_conflicts[key]
+                key = row_keys[row_dst]
+                new_key = row_keys[row_dst] = key + tile_row_keys[dst]
+                return delta + row_conflicts[new_key] - row_conflicts[key]
+        goal = list(self.goal_state)
+        path = []  # Actions of the current branch
+        found = -1  # Sentinel returned once the goal is hit
+        profiling = stats.profiling
+        timing = stats.time_heuristic  # Measure time spent computing h
+        clock = timeit.default_timer
+
+        def search(blank, g, h, bound, last_action):
+            f = g + h
+            if f > bound:
+                return f  # Candidate for the next bound
+            if h == 0 and board == goal:
+                return found
+            stats.nodes_expanded += 1
+            if profiling:
+                stats.record_expansion(tuple(board), g)
+            if g >= stats.peak_frontier:
+                stats.peak_frontier = stats.peak_visited = g + 1  # States on the current path
+            minimum = float('inf')
+            pruned = inverse.get(last_action)  # Never undo the previous move
+            for new_blank, action in blank_moves[blank]:
+                if action == pruned:
+                    stats.duplicates += 1
+                    continue
+                stats.nodes_generated += 1
+                tile = board[new_blank]  # Tile that slides into the blank
+                board[blank], board[new_blank] = tile, 0
+                if timing:
+                    started = clock()
+                if h_table is not None:
+                    new_h = h + h_table[tile][blank] - h_table[tile][new_blank]
+                elif incremental_lc:
+                    new_h = (h + md_table[tile][blank] - md_table[tile][new_blank]
+                             + shift_tile(tile, new_blank, blank))
+                elif bounded is not None:
+                    new_h = bounded(tuple(board), bound - g - 1)  # Exact only up to the bound
+                else:
+                    new_h = heuristic_func(tuple(board))
+                if timing:
+                    stats.heuristic_time += clock() - started
+                path.append(action)
+                result = search(new_blank, g + 1, new_h, bound, action)
+                if result == found:
+                    return found
+                path.pop()
+                board[blank], board[new_blank] = 0, tile  # Undo the move
+                if incremental_lc:
+                    shift_tile(tile, blank, new_blank)
+                if result < minimum:
+                    minimum = result
+            return minimum
+
+        blank = board.index(0)
+        start_h = heuristic_func(self.start_state)
+        bound = start_h
+        while True:
+            result = search(blank, 0, start_h, bound, None)
+            if result == found:
+                return stats.finish(path)
+            if result == float('inf'):
+                return stats.finish(None)  # Nothing left to explore
+            bound = result  # Smallest f that exceeded the bound
+
+    def solve_many(self, starts, stats=None):
+        """
+        Solve many start states against the goal with one backward BFS.
+
+        The BFS runs from the goal over packed states and stops as soon as
+        every solvable start has been reached, so the work is bounded by the
+        deepest start instead of adding up over all starts. Each reached
+        state links to the state one move closer to the goal and the move
+        that gets there (the inverse of the BFS move), so the path of a
+        start is read off in order by following the links. Start states are
+        validated; self.start_state is not used or changed.
+
+        The search holds every state up to the depth of the deepest start,
+        so it suits boards up to 3x3 or starts close to the goal.
+
+        Args:
+            starts: Iterable of start states (lists or tuples of tiles)
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats. solution_depth
+                   is the length of the longest path.
+
+        Returns:
+            List with one optimal list of actions per start, in input order,
+            or None for starts that cannot reach the goal
+
+        Raises:
+            ValueError: If a start state does not fit the board
+        """
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+
+        starts = [self.validate_state(start) for start in starts]
+        goal_parity = self.parity(self.goal_state)
+        goal = self.encode(self.goal_state)
+        codes = [self.encode(start) if self.parity(start) == goal_parity else None
+                 for start in starts]
+        remaining = set(code for code in codes if code is not None)
+        remaining.discard(goal)
+
+        links = {goal: None}  # state -> (state one move closer to the goal, action)
+        inverse = self.inverse_actions
+        get_neighbors = self.get_packed_neighbors
+        queue = deque([goal])
+        layer_left = 1  # States of the current depth still in the queue
+        depth = 0
+        profiling = stats.profiling
+
+        while remaining and queue:
+            if len(queue) > stats.peak_frontier:
+                stats.peak_frontier = len(queue)
+            state = queue.popleft()
+            stats.nodes_expanded += 1
+            if profiling:
+                stats.record_expansion(state, depth)
+            for neighbor, action in get_neighbors(state):
+                stats.nodes_generated += 1
+                if neighbor in links:
+                    stats.duplicates += 1
+                    continue
+                links[neighbor] = (state, inverse[action])
+                queue.append(neighbor)
+                remaining.discard(neighbor)
+            layer_left -= 1
+            if layer_left == 0:
+                layer_left = len(queue)
+                depth += 1
+        stats.peak_visited = len(links)
+
+        paths = []
+        for code in codes:
+            if code is None:
+                paths.append(None)  # Goal is unreachable from this start
+                continue
+            path = []
+            link = links[code]
+            while link is not None:
+                code, action = link
+                path.append(action)
+                link = links[code]
+            paths.append(path)
+        stats.finish(max((path for path in paths if path is not None), key=len, default=None))
+        return paths
+
+    def vector_bfs(self, stats=None):
+        """
+        Solve the puzzle with a layer-synchronous BFS over NumPy arrays.
+
+        Whole layers are expanded with vectorized moves and deduplicated
+        against a visited array indexed by permutation rank (see
+        puzzle_vector), which avoids the per-state interpreter overhead of
+        bfs on wide layers. Needs NumPy and a board of at most
+        puzzle_tables.MAX_TABLE_CELLS cells.
+
+        Args:
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats
+
+        Returns:
+            List of actions to reach goal, or None if no solution exists
+        """
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        if not self.solvable:
+            return stats.finish(None)  # Goal is unreachable, skip the search
+        return stats.finish(puzzle_vector.vector_solve(self, stats))
+
+    def solve(self, stats=None):
+        """
+        Find an optimal solution with the solver suited to the board size.
+
+        Boards small enough for a full distance table (see
+        puzzle_tables.MAX_TABLE_CELLS) are answered from the table of the goal,
+        built once per goal. Larger boards have far too many states to
+        enumerate or to keep in an open list, so they use IDA*, whose memory
+        only grows with the solution depth, with the additive pattern
+        databases of the goal (built once per goal, about half a minute for
+        the 15-puzzle).
+
+        Args:
+            stats: Optional SearchStats to fill in (a new one is created otherwise);
+                   either way it is attached as self.stats
+
+        Returns:
+            List of actions leading to goal, or None if no solution exists
+        """
+        if self.rows * self.cols > puzzle_tables.MAX_TABLE_CELLS:
+            return self.ida_star(self.pattern_database, stats)
+        stats = SearchStats() if stats is None else stats
+        self.stats = stats
+        stats.start()
+        return stats.finish(self.table_solve())
+
+    def table_solve(self):
+        """
+        Solve the puzzle with the precomputed distance table of the goal state.
+
+        The table is filled by one retrograde BFS the first time a goal is used
+        and then cached, so later queries against the same goal only walk the
+        stored best moves, one lookup per step of the solution.
+
+        Returns:
+            List of actions to reach goal, or None if no solution exists
+        """
+        if not self.solvable:
+            return None  # Goal is unreachable, skip the search
+        return puzzle_tables.table_solve(self)
+
+    def save_distance_table(self, path):
+        """
+        Write the distance table of the goal state to a binary file.
+
+        The file starts with a versioned header holding the board shape, the
+        action order, the goal state and a checksum, followed by one byte per
+        permutation rank.
+
+        Args:
+            path: Destination file path
+        """
+        puzzle_tables.save_distance_table(self, path)
+
+    def load_distance_table(self, path, verify=False):
+        """
+        Map a saved distance table read-only and use it for table_solve.
+
+        Processes loading the same file share one page-cache copy and skip
+        building the table.
+
+        Args:
+            path: Table file written by save_distance_table for this goal
+            verify: If True, also check the table checksum
+
+        Raises:
+            ValueError: If the file does not match this board and goal
+        """
+        puzzle_tables.load_distance_table(self, path, verify)
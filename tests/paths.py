@@ -0,0 +1,42 @@
+# Shared helpers of the search tests: seeded instances and path checks
+
+import random
+import unittest
+
+from Sava_1_2 import EightPuzzle
+
+FIVE_GOAL = (1, 2, 3, 4, 5, 0)
+EIGHT_GOAL = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+HARDEST_EIGHT = (8, 6, 7, 2, 5, 4, 3, 0, 1)  # 31 moves from EIGHT_GOAL
+
+
+def eight_starts(count, seed=0):
+    """Seeded random solvable 8-puzzle starts, plus the hardest one."""
+    rng = random.Random(seed)
+    puzzle = EightPuzzle(EIGHT_GOAL, EIGHT_GOAL)
+    starts = [HARDEST_EIGHT]
+    while len(starts) < count:
+        state = tuple(rng.sample(range(9), 9))
+        if puzzle.parity(state) == puzzle.parity(EIGHT_GOAL):
+            starts.append(state)
+    return starts
+
+
+def instance_lines(starts, goal):
+    """Batch input lines solving every start against one goal."""
+    return [' '.join(map(str, start)) + ' | ' + ' '.join(map(str, goal)) for start in starts]
+
+
+class PathCase(unittest.TestCase):
+    def assertSolves(self, puzzle, moves, optimal, bound=1.0):
+        """Check that moves lead from start to goal within bound times the optimum."""
+        if optimal is None:
+            self.assertIsNone(moves)
+            return
+        self.assertIsNotNone(moves)
+        state = puzzle.start_state
+        for action in moves:
+            state = puzzle.move(state, action)
+        self.assertEqual(state, puzzle.goal_state)
+        self.assertGreaterEqual(len(moves), optimal)
+        self.assertLessEqual(len(moves), bound * optimal + 1e-9)
@@ -0,0 +1,53 @@
+# Tests of weighted and anytime A* and their suboptimality bounds
+
+import unittest
+
+import puzzle_tables
+from Sava_1_2 import EightPuzzle
+from tests.paths import EIGHT_GOAL, HARDEST_EIGHT, PathCase, eight_starts
+
+
+class BoundedSearchTest(PathCase):
+    """Weighted and anytime A* (user-021)."""
+
+    def setUp(self):
+        self.puzzle = EightPuzzle(EIGHT_GOAL, EIGHT_GOAL)
+        self.starts = eight_starts(12)
+
+    def test_weighted_a_star_stays_within_its_bounds(self):
+        puzzle = self.puzzle
+        for name in ('manhattan_distance', 'out_of_place'):
+            for weight in (1.0, 1.5, 3.0):
+                for state in self.starts:
+                    puzzle.set_start_state(state)
+                    with self.subTest(heuristic=name, weight=weight, start=state):
+                        moves = puzzle.weighted_a_star(getattr(puzzle, name), weight, packed=True)
+                        bound = puzzle.stats.suboptimality_bound
+                        self.assertLessEqual(bound, weight + 1e-9)
+                        self.assertSolves(puzzle, moves, puzzle_tables.table_distance(puzzle, state), bound)
+
+    def test_anytime_a_star_without_budget_is_optimal(self):
+        puzzle = self.puzzle
+        for name in ('manhattan_distance', 'out_of_place'):
+            for state in self.starts:
+                puzzle.set_start_state(state)
+                with self.subTest(heuristic=name, start=state):
+                    moves = puzzle.anytime_a_star(getattr(puzzle, name), 3.0)
+                    self.assertEqual(puzzle.stats.suboptimality_bound, 1.0)
+                    self.assertSolves(puzzle, moves, puzzle_tables.table_distance(puzzle, state))
+
+    def test_anytime_a_star_within_a_node_budget(self):
+        puzzle = self.puzzle
+        puzzle.set_start_state(HARDEST_EIGHT)
+        moves = puzzle.anytime_a_star(puzzle.manhattan_distance, 3.0, max_nodes=1000)
+        self.assertLessEqual(puzzle.stats.nodes_expanded, 1000)
+        self.assertSolves(puzzle, moves, 31, puzzle.stats.suboptimality_bound)
+        self.assertIsNone(puzzle.anytime_a_star(puzzle.manhattan_distance, 3.0, max_nodes=10))
+
+    def test_weight_below_one_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.puzzle.weighted_a_star(self.puzzle.manhattan_distance, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+# Tests of the additive pattern databases (pattern_db.py)
+
+import random
+import unittest
+
+import pattern_db
+import puzzle_batch
+import puzzle_tables
+from Sava_1_2 import EightPuzzle
+
+GOAL = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+
+
+class PatternDatabaseTest(unittest.TestCase):
+    """Additive pattern databases (user-015)."""
+
+    def test_heuristic_is_admissible_and_dominates_manhattan(self):
+        puzzle = EightPuzzle(GOAL, GOAL)
+        table = puzzle_tables.get_distance_table(puzzle)
+        rng = random.Random(0)
+        for _ in range(500):
+            state = tuple(rng.sample(range(9), 9))
+            distance = puzzle_tables.table_distance(puzzle, state, table)
+            if distance is None:
+                continue
+            h = puzzle.pattern_database(state)
+            self.assertLessEqual(h, distance, state)
+            self.assertGreaterEqual(h, puzzle.manhattan_distance(state), state)
+
+    def test_batch_goal_cache_bounds_the_databases(self):
+        pattern_db._pattern_databases.clear()
+        rng = random.Random(1)
+        goals = [rng.sample(range(9), 9) for _ in range(5)]
+        lines = [' '.join(map(str, goal)) + ' | ' + ' '.join(map(str, goal)) for goal in goals]
+        size = puzzle_batch.GOAL_CACHE_SIZE
+        puzzle_batch.GOAL_CACHE_SIZE = 2
+        try:
+            list(puzzle_batch.solve_stream(lines, 'eight', 'a_star-pdb'))
+        finally:
+            puzzle_batch.GOAL_CACHE_SIZE = size
+        goals_held = {key[2] for key in pattern_db._pattern_databases}
+        self.assertEqual(goals_held, {tuple(goal) for goal in goals[-2:]})
+
+
+if __name__ == '__main__':
+    unittest.main()
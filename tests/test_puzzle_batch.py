@@ -0,0 +1,48 @@
+# Tests of the streaming batch solver and its worker pool (puzzle_batch.py)
+
+import contextlib
+import io
+import unittest
+
+import puzzle_batch
+from tests.paths import EIGHT_GOAL, eight_starts, instance_lines
+
+
+class StreamTest(unittest.TestCase):
+    """Streaming solver with per-line errors (user-009)."""
+
+    def test_results_keep_input_order_and_report_bad_lines(self):
+        lines = instance_lines(eight_starts(4), EIGHT_GOAL)
+        lines.insert(2, '1 2 3')
+        results = list(puzzle_batch.solve_stream(lines, 'eight', 'a_star-md'))
+        self.assertEqual([result['line'] for result in results], [1, 2, 3, 4, 5])
+        self.assertIn('error', results[2])
+        self.assertEqual(results[0]['length'], 31)
+
+
+class WorkerPoolTest(unittest.TestCase):
+    """Worker pool, chunking and argument checks (user-010)."""
+
+    def test_pool_matches_the_serial_stream(self):
+        lines = instance_lines(eight_starts(8), EIGHT_GOAL) + ['not an instance']
+        serial = list(puzzle_batch.solve_stream(lines, 'eight', 'a_star-md'))
+        for ordered in (True, False):
+            with self.subTest(ordered=ordered):
+                parallel = list(puzzle_batch.solve_stream_parallel(lines, 'eight', 'a_star-md', workers=2,
+                                                                   chunk_size=3, ordered=ordered))
+                parallel.sort(key=lambda result: result['line'])
+                self.assertEqual([result.get('length') for result in parallel],
+                                 [result.get('length') for result in serial])
+
+    def test_invalid_chunk_size_and_workers(self):
+        with self.assertRaises(ValueError):
+            list(puzzle_batch.solve_stream_parallel([], 'eight', 'a_star-md', chunk_size=0))
+        for argv in (['--chunk-size', '0'], ['--workers', '-1']):
+            with self.subTest(argv=argv):
+                with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as raised:
+                    puzzle_batch.main(argv)
+                self.assertEqual(raised.exception.code, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+# Tests of the benchmark suite (puzzle_bench.py)
+
+import contextlib
+import io
+import unittest
+
+import puzzle_bench
+
+
+class BenchmarkTest(unittest.TestCase):
+    """Seeded benchmark reports (user-012)."""
+
+    def test_report(self):
+        report = puzzle_bench.run_benchmark('five', ['bfs', 'table'], per_bucket=1, warmup=0, repeat=1)
+        rows = {(row['algorithm'], row['depth']): row for row in report['results']}
+        self.assertEqual(len(rows), 2 * len(puzzle_bench.DEPTH_BUCKETS['five']))
+        for (algorithm, _), row in rows.items():
+            self.assertEqual(row['suboptimal'], 0)
+            self.assertNotIn('peak_rss_kb', row)  # Reported once for the run in meta
+            if algorithm == 'table':
+                self.assertEqual(row['median_expanded'], 0)  # Not left over from bfs
+        self.assertIn('peak_rss_kb', report['meta'])
+
+    def test_compare_with_a_zero_baseline(self):
+        report = puzzle_bench.run_benchmark('five', ['table'], per_bucket=1, warmup=0, repeat=1)
+        baseline = {'results': [dict(row, median_latency=0.0) for row in report['results']]}
+        rows = puzzle_bench.compare_results(baseline, report)
+        self.assertTrue(all(row['ratio'] is None and not row['regression'] for row in rows))
+
+    def test_invalid_counts_are_rejected(self):
+        for argv in (['--repeat', '0'], ['--instances', '0'], ['--warmup', '-1']):
+            with self.subTest(argv=argv):
+                with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as raised:
+                    puzzle_bench.main(argv)
+                self.assertEqual(raised.exception.code, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# Tests of the asyncio solver service: coalescing, caching and validation
+
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import puzzle_service
+from puzzle_service import SolverClient, SolverService
+
+GOAL = [1, 2, 3, 4, 5, 6, 7, 8, 0]
+START = [8, 6, 7, 2, 5, 4, 3, 0, 1]
+
+
+class ServiceTest(unittest.TestCase):
+    """Solver service, request coalescing and result cache (user-018)."""
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def run_service(self, body, cache_bytes=puzzle_service.DEFAULT_CACHE_BYTES):
+        async def main():
+            async with SolverService(self.executor, cache_bytes=cache_bytes) as service:
+                return await body(service)
+        return asyncio.run(main())
+
+    def test_identical_requests_are_coalesced_then_cached(self):
+        async def body(service):
+            results = await asyncio.gather(*[service.solve('eight', START, GOAL) for _ in range(5)])
+            cached = await service.solve('eight', START, GOAL)
+            return results, cached, service.stats()
+
+        results, cached, stats = self.run_service(body)
+        self.assertEqual({result['length'] for result in results}, {31})
+        self.assertFalse(any(result['cached'] for result in results))
+        self.assertTrue(cached['cached'])
+        self.assertEqual(cached['moves'], results[0]['moves'])
+        self.assertEqual((stats['misses'], stats['coalesced'], stats['hits']), (1, 4, 1))
+        self.assertEqual((stats['in_flight'], stats['cached_results']), (0, 1))
+
+    def test_coalesced_requests_run_one_solve(self):
+        calls = []
+        release = threading.Event()
+        solve_request = puzzle_service.solve_request
+
+        def slow_solve(*key):
+            calls.append(key)
+            release.wait(5)
+            return solve_request(*key)
+
+        async def body(service):
+            tasks = [asyncio.ensure_future(service.solve('eight', START, GOAL)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        puzzle_service.solve_request = slow_solve
+        try:
+            results = self.run_service(body)
+        finally:
+            puzzle_service.solve_request = solve_request
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({result['moves'] for result in results}), 1)
+
+    def test_cache_is_bounded_and_evicts_least_recently_used(self):
+        starts = [[1, 2, 3, 4, 5, 6, 7, 0, 8], [1, 2, 3, 4, 5, 6, 0, 7, 8], [1, 2, 3, 4, 0, 6, 7, 5, 8]]
+
+        async def body(service):
+            await service.solve('eight', starts[0], GOAL)
+            await service.solve('eight', starts[1], GOAL)
+            touched = await service.solve('eight', starts[0], GOAL)  # Now the most recently used
+            await service.solve('eight', starts[2], GOAL)
+            kept = await service.solve('eight', starts[0], GOAL)
+            evicted = await service.solve('eight', starts[1], GOAL)
+            return touched, kept, evicted, service.stats()
+
+        # Room for two of these short results but not three
+        budget = 2 * (puzzle_service.ENTRY_OVERHEAD + 8 * 2 * len(GOAL)) + 20
+        touched, kept, evicted, stats = self.run_service(body, cache_bytes=budget)
+        self.assertTrue(touched['cached'])
+        self.assertTrue(kept['cached'])
+        self.assertFalse(evicted['cached'])
+        self.assertLessEqual(stats['cached_bytes'], budget)
+        self.assertEqual(stats['cached_results'], 2)
+
+        touched, kept, evicted, stats = self.run_service(body, cache_bytes=0)
+        self.assertEqual((stats['hits'], stats['cached_results']), (0, 0))
+
+    def test_invalid_requests(self):
+        requests = [
+            {'puzzle': 'eight', 'start': [1.5, 2, 3, 4, 5, 6, 7, 8, 0], 'goal': GOAL},
+            {'puzzle': 'eight', 'start': [True, 2, 3, 4, 5, 6, 7, 8, 0], 'goal': GOAL},
+            {'puzzle': 'eight', 'start': [1, 2, 3], 'goal': GOAL},
+            {'puzzle': 'eight', 'start': START, 'goal': GOAL, 'algorithm': 'bfs'},
+            {'puzzle': 'nine', 'start': START, 'goal': GOAL},
+            ['not', 'an', 'object'],
+        ]
+
+        async def body(service):
+            return [await service.handle_request(request) for request in requests], service.stats()
+
+        responses, stats = self.run_service(body)
+        for response in responses:
+            self.assertIn('error', response)
+        self.assertIn("'start' tiles must be integers", responses[0]['error'])
+        self.assertEqual(stats['misses'], 0)
+
+    def test_unix_socket_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'service.sock')
+
+            async def body(service):
+                server = await service.serve_unix(path)
+                async with server:
+                    client = await SolverClient.connect(path)
+                    try:
+                        responses = await asyncio.gather(client.solve('eight', START, GOAL),
+                                                         client.solve('eight', START, GOAL),
+                                                         client.solve('five', [1, 2, 3], [1, 2, 3]))
+                        stats = await client.stats()
+                    finally:
+                        await client.close()
+                return responses, stats
+
+            responses, stats = self.run_service(body)
+        self.assertEqual([response.get('length') for response in responses[:2]], [31, 31])
+        self.assertIn('error', responses[2])
+        self.assertEqual(stats['misses'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# Tests for the distance tables and their binary file format (puzzle_tables.py)
+
+import itertools
+import os
+import tempfile
+import unittest
+
+import puzzle_batch
+import puzzle_tables
+from Sava_1_1 import FivePuzzle
+
+GOAL = (1, 2, 3, 4, 5, 0)
+
+
+class RankTest(unittest.TestCase):
+    """Lehmer-rank indexing of the distance tables (user-007)."""
+
+    def test_ranks_are_a_bijection_in_lexicographic_order(self):
+        ranks = [puzzle_tables.rank_permutation(state) for state in itertools.permutations(range(6))]
+        self.assertEqual(ranks, list(range(720)))
+
+
+class TableFileTest(unittest.TestCase):
+    """Versioned, memory-mapped table files (user-008) and the goal cache bound (user-009)."""
+
+    def setUp(self):
+        self.puzzle = FivePuzzle(GOAL, GOAL)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'five.bin')
+        puzzle_tables.save_distance_table(self.puzzle, self.path)
+        with open(self.path, 'rb') as f:
+            self.data = f.read()
+
+    def tearDown(self):
+        puzzle_tables._distance_tables.clear()  # Drop the mappings before removing their files
+        self.directory.cleanup()
+
+    def write(self, data):
+        path = os.path.join(self.directory.name, 'other.bin')
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_round_trip(self):
+        built = puzzle_tables.build_distance_table(self.puzzle)
+        table = puzzle_tables.load_distance_table(self.puzzle, self.path, verify=True)
+        self.assertEqual(bytes(table), bytes(built))
+        self.assertIs(puzzle_tables.get_distance_table(self.puzzle), table)
+
+    def test_loaded_table_solves(self):
+        puzzle = FivePuzzle((4, 1, 3, 0, 2, 5), GOAL)
+        puzzle.load_distance_table(self.path)
+        moves = puzzle.table_solve()
+        self.assertEqual(len(moves), len(puzzle.bfs()))
+
+    def test_corrupted_table_fails_the_checksum(self):
+        corrupted = bytearray(self.data)
+        corrupted[-1] ^= 1
+        path = self.write(corrupted)
+        puzzle_tables.load_distance_table(self.puzzle, path)  # Checksum only read with verify
+        with self.assertRaisesRegex(ValueError, 'checksum'):
+            puzzle_tables.load_distance_table(self.puzzle, path, verify=True)
+
+    def test_truncated_files_are_rejected(self):
+        header_size = len(puzzle_tables.pack_header(self.puzzle, b''))
+        for length in (0, 4, header_size - 12, header_size - 1, header_size, len(self.data) - 1):
+            with self.subTest(length=length):
+                with self.assertRaises(ValueError):
+                    puzzle_tables.load_distance_table(self.puzzle, self.write(self.data[:length]))
+
+    def test_oversized_file_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, 'oversized'):
+            puzzle_tables.load_distance_table(self.puzzle, self.write(self.data + b'\0'))
+
+    def test_table_of_another_goal_is_rejected(self):
+        other = FivePuzzle(GOAL, (0, 1, 2, 3, 4, 5))
+        with self.assertRaisesRegex(ValueError, 'not a 2x3 table'):
+            puzzle_tables.load_distance_table(other, self.path)
+
+    def test_open_distance_table_builds_once(self):
+        directory = os.path.join(self.directory.name, 'tables')
+        table = puzzle_tables.open_distance_table(self.puzzle, directory)
+        self.assertTrue(os.path.exists(puzzle_tables.table_path(self.puzzle, directory)))
+        self.assertIs(puzzle_tables.open_distance_table(self.puzzle, directory), table)
+
+    def test_batch_goal_cache_bounds_the_tables(self):
+        puzzle_tables._distance_tables.clear()
+        goals = list(itertools.permutations(range(6)))[:5]
+        lines = [' '.join(map(str, goal)) + ' | ' + ' '.join(map(str, goal)) for goal in goals]
+        size = puzzle_batch.GOAL_CACHE_SIZE
+        puzzle_batch.GOAL_CACHE_SIZE = 2
+        try:
+            results = list(puzzle_batch.solve_stream(lines, 'five', 'table'))
+        finally:
+            puzzle_batch.GOAL_CACHE_SIZE = size
+        self.assertEqual([result['length'] for result in results], [0] * len(goals))
+        self.assertEqual(len(puzzle_tables._distance_tables), 2)
+
+    def test_larger_boards_have_no_table(self):
+        from sliding_puzzle import SlidingPuzzle
+        goal = tuple(range(1, 16)) + (0,)
+        with self.assertRaises(ValueError):
+            puzzle_tables.build_distance_table(SlidingPuzzle(goal, goal, rows=4, cols=4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+# Tests of the NumPy layer-synchronous BFS (puzzle_vector.py)
+
+import itertools
+import unittest
+
+import puzzle_tables
+import puzzle_vector
+from Sava_1_1 import FivePuzzle
+from Sava_1_2 import EightPuzzle
+from tests.paths import EIGHT_GOAL, FIVE_GOAL, PathCase, eight_starts
+
+
+@unittest.skipIf(puzzle_vector.np is None, "NumPy is not installed")
+class VectorBfsTest(PathCase):
+    """Vectorized BFS distances and paths (user-020)."""
+
+    def test_distances_match_the_tables(self):
+        for puzzle in (FivePuzzle(FIVE_GOAL, FIVE_GOAL), EightPuzzle(EIGHT_GOAL, EIGHT_GOAL)):
+            with self.subTest(puzzle=type(puzzle).__name__):
+                distances = puzzle_vector.bfs_layers(puzzle, puzzle.goal_state).tolist()
+                table = puzzle_tables.build_distance_table(puzzle)
+                expected = [entry if entry == puzzle_tables.UNREACHED else entry >> 2 for entry in table]
+                self.assertEqual(distances, expected)
+
+    def test_every_five_puzzle_permutation(self):
+        puzzle = FivePuzzle(FIVE_GOAL, FIVE_GOAL)
+        for state in itertools.permutations(range(6)):
+            puzzle.set_start_state(state)
+            self.assertSolves(puzzle, puzzle.vector_bfs(), puzzle_tables.table_distance(puzzle, state))
+
+    def test_eight_puzzle_starts(self):
+        puzzle = EightPuzzle(EIGHT_GOAL, EIGHT_GOAL)
+        for state in eight_starts(6):
+            puzzle.set_start_state(state)
+            self.assertSolves(puzzle, puzzle.vector_bfs(), puzzle_tables.table_distance(puzzle, state))
+
+
+if __name__ == '__main__':
+    unittest.main()
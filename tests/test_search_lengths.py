@@ -0,0 +1,125 @@
+# Tests that every optimal search returns a valid path of the optimal
+# length, checked against puzzle_tables.table_distance
+
+import itertools
+import random
+import unittest
+
+import puzzle_tables
+from Sava_1_1 import FivePuzzle
+from Sava_1_2 import EightPuzzle
+from sliding_puzzle import SlidingPuzzle, max_heuristic
+from tests.paths import EIGHT_GOAL, FIVE_GOAL, PathCase, eight_starts
+
+
+class FivePuzzleTest(PathCase):
+    def check_every_permutation(self, search):
+        puzzle = FivePuzzle(FIVE_GOAL, FIVE_GOAL)
+        table = puzzle_tables.build_distance_table(puzzle)
+        for state in itertools.permutations(range(6)):
+            puzzle.set_start_state(state)
+            with self.subTest(start=state):
+                self.assertSolves(puzzle, search(puzzle), puzzle_tables.table_distance(puzzle, state, table))
+
+    def test_bfs(self):
+        """Parent-link BFS (user-001) over tuple and packed states (user-002)."""
+        self.check_every_permutation(lambda puzzle: puzzle.bfs())
+        self.check_every_permutation(lambda puzzle: puzzle.bfs(packed=True))
+
+    def test_ids(self):
+        """IDS over packed states (user-002) and with a transposition table (user-013)."""
+        self.check_every_permutation(lambda puzzle: puzzle.ids(packed=True))
+        self.check_every_permutation(lambda puzzle: puzzle.transposition_ids(packed=True))
+
+    def test_bidirectional_bfs(self):
+        """Bidirectional BFS (user-006)."""
+        self.check_every_permutation(lambda puzzle: puzzle.bidirectional_bfs())
+
+    def test_table_solve(self):
+        """Distance table descent (user-007) and the shared solve entry point (user-014)."""
+        self.check_every_permutation(lambda puzzle: puzzle.table_solve())
+        self.check_every_permutation(lambda puzzle: puzzle.solve())
+
+
+class EightPuzzleTest(PathCase):
+    def setUp(self):
+        self.puzzle = EightPuzzle(EIGHT_GOAL, EIGHT_GOAL)
+        self.starts = eight_starts(12)
+
+    def check(self, search):
+        puzzle = self.puzzle
+        for state in self.starts:
+            puzzle.set_start_state(state)
+            with self.subTest(start=state):
+                self.assertSolves(puzzle, search(puzzle), puzzle_tables.table_distance(puzzle, state))
+
+    def test_a_star(self):
+        """A* with incremental heuristics (user-004) on both open lists (user-017)."""
+        for name in ('manhattan_distance', 'out_of_place', 'linear_conflict', 'pattern_database'):
+            for packed in (False, True):
+                for open_list in ('bucket', 'heap'):
+                    with self.subTest(heuristic=name, packed=packed, open_list=open_list):
+                        self.check(lambda puzzle: puzzle.a_star(getattr(puzzle, name), packed=packed,
+                                                                open_list=open_list))
+
+    def test_heap_open_list_lowers_g_of_seen_states(self):
+        """Heap open list reopening states (user-017)."""
+        # The pattern database is inconsistent here: the heap open list used to
+        # keep the first g of a state and returned 25 moves instead of 23
+        goal = tuple(range(9))
+        puzzle = EightPuzzle((2, 0, 8, 6, 1, 4, 3, 5, 7), goal)
+        for packed in (False, True):
+            with self.subTest(packed=packed):
+                moves = puzzle.a_star(puzzle.pattern_database, packed=packed, open_list='heap')
+                self.assertSolves(puzzle, moves, 23)
+
+    def test_fractional_heuristic_falls_back_to_the_heap(self):
+        """Bucket queue fallback for non-integer heuristics (user-017)."""
+        puzzle = EightPuzzle((1, 2, 3, 4, 5, 6, 0, 7, 8), EIGHT_GOAL)
+        half = lambda state: 0.5 * puzzle.manhattan_distance(state)
+        for open_list in ('bucket', 'heap'):
+            with self.subTest(open_list=open_list):
+                self.assertEqual(puzzle.a_star(half, open_list=open_list), ['L', 'L'])
+
+    def test_a_star_max(self):
+        """Max-of-heuristics composition (user-016)."""
+        self.check(lambda puzzle: puzzle.a_star(max_heuristic(puzzle.pattern_database,
+                                                              puzzle.linear_conflict)))
+
+    def test_ida_star(self):
+        """IDA* (user-005) with pattern databases (user-015) and linear conflicts (user-016)."""
+        for name in ('manhattan_distance', 'linear_conflict', 'pattern_database', 'pattern_database_lc'):
+            with self.subTest(heuristic=name):
+                self.check(lambda puzzle: puzzle.ida_star(getattr(puzzle, name)))
+        self.check(lambda puzzle: puzzle.ida_star(max_heuristic(puzzle.pattern_database,
+                                                                puzzle.linear_conflict)))
+
+    def test_bidirectional_a_star(self):
+        """Bidirectional A* and its backward heuristic (user-006)."""
+        for name in ('manhattan_distance', 'linear_conflict'):
+            with self.subTest(heuristic=name):
+                self.check(lambda puzzle: puzzle.bidirectional_a_star(getattr(puzzle, name)))
+        with self.assertRaises(ValueError):
+            self.puzzle.bidirectional_a_star(lambda state: 0)
+
+    def test_solve(self):
+        """Shared solve entry point (user-014)."""
+        self.check(lambda puzzle: puzzle.solve())
+
+
+class FifteenPuzzleTest(PathCase):
+    def test_ida_star_heuristics_agree(self):
+        """N x M core on the 4x4 board (user-014) with linear conflicts (user-016)."""
+        goal = tuple(range(1, 16)) + (0,)
+        puzzle = SlidingPuzzle(goal, goal, 4, 4)
+        rng = random.Random(1)
+        state = goal
+        for _ in range(40):
+            state = rng.choice(puzzle.get_neighbors(state))[0]
+        puzzle.set_start_state(state)
+        optimal = len(puzzle.ida_star(puzzle.manhattan_distance))
+        self.assertSolves(puzzle, puzzle.ida_star(puzzle.linear_conflict), optimal)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+# Tests of the search statistics (search_stats.py)
+
+import unittest
+
+from search_stats import SearchStats
+
+
+class EffectiveBranchingFactorTest(unittest.TestCase):
+    """SearchStats branching factor (user-011)."""
+
+    def branching(self, generated, depth):
+        stats = SearchStats()
+        stats.nodes_generated = generated
+        stats.solution_depth = depth
+        return stats
+
+    def test_uniform_tree(self):
+        # 2 + 4 + 8 generated states for a binary tree of depth 3
+        self.assertAlmostEqual(self.branching(14, 3).effective_branching_factor, 2.0, places=6)
+
+    def test_deep_searches_do_not_overflow(self):
+        for generated, depth in ((10 ** 7, 48), (10 ** 9, 80), (50, 2000)):
+            with self.subTest(generated=generated, depth=depth):
+                stats = self.branching(generated, depth)
+                branching = stats.effective_branching_factor
+                self.assertGreaterEqual(branching, 0.0)
+                total = sum(branching ** i for i in range(depth + 1))
+                self.assertAlmostEqual(total / (generated + 1), 1.0, places=4)
+                str(stats)
+                stats.as_dict()
+
+    def test_no_solution(self):
+        self.assertIsNone(self.branching(100, None).effective_branching_factor)
+        self.assertIsNone(self.branching(100, 0).effective_branching_factor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# Tests of the parity solvability check against full reachability
+
+import itertools
+import random
+import unittest
+
+import puzzle_tables
+from sliding_puzzle import SlidingPuzzle
+
+# Board shapes and goals checked; the 3x3 board is sampled instead of enumerated
+SHAPES = [(2, 2), (2, 3), (3, 2), (3, 3)]
+SAMPLE = 3000
+
+
+def goals(size):
+    """Blank-last and blank-first goals of a board."""
+    return [tuple(range(1, size)) + (0,), tuple(range(size))]
+
+
+class ParityTest(unittest.TestCase):
+    """Inversion-parity solvability check (user-003)."""
+
+    def test_parity_matches_reachability(self):
+        rng = random.Random(0)
+        for rows, cols in SHAPES:
+            size = rows * cols
+            for goal in goals(size):
+                with self.subTest(rows=rows, cols=cols, goal=goal):
+                    puzzle = SlidingPuzzle(goal, goal, rows, cols)
+                    table = puzzle_tables.build_distance_table(puzzle)
+                    if size < 9:
+                        states = itertools.permutations(range(size))
+                    else:
+                        states = (tuple(rng.sample(range(size), size)) for _ in range(SAMPLE))
+                    solvable = 0
+                    for state in states:
+                        puzzle.set_start_state(state)
+                        reachable = puzzle_tables.table_distance(puzzle, state, table) is not None
+                        self.assertEqual(puzzle.solvable, reachable, state)
+                        solvable += reachable
+                    if size < 9:
+                        # Exactly half of the permutations can reach the goal
+                        self.assertEqual(solvable * 2, len(table))
+
+    def test_unsolvable_start_gives_no_solution(self):
+        goal = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+        puzzle = SlidingPuzzle((2, 1, 3, 4, 5, 6, 7, 8, 0), goal, 3, 3)
+        self.assertFalse(puzzle.solvable)
+        self.assertIsNone(puzzle.solve())
+        self.assertEqual(puzzle.solve_many([puzzle.start_state, goal]), [None, []])
+
+
+if __name__ == '__main__':
+    unittest.main()
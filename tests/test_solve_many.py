@@ -0,0 +1,38 @@
+# Tests of the many-start, single-goal search (SlidingPuzzle.solve_many)
+
+import itertools
+import unittest
+
+import puzzle_batch
+import puzzle_tables
+from Sava_1_1 import FivePuzzle
+from Sava_1_2 import EightPuzzle
+from tests.paths import EIGHT_GOAL, FIVE_GOAL, PathCase, eight_starts, instance_lines
+
+
+class SolveManyTest(PathCase):
+    """Backward multi-start BFS and the grouped batch mode (user-019)."""
+
+    def check(self, puzzle, starts):
+        for state, moves in zip(starts, puzzle.solve_many(starts)):
+            puzzle.set_start_state(state)
+            self.assertSolves(puzzle, moves, puzzle_tables.table_distance(puzzle, state))
+
+    def test_every_five_puzzle_permutation(self):
+        self.check(FivePuzzle(FIVE_GOAL, FIVE_GOAL), list(itertools.permutations(range(6))))
+
+    def test_eight_puzzle_starts(self):
+        self.check(EightPuzzle(EIGHT_GOAL, EIGHT_GOAL), eight_starts(12))
+
+    def test_grouped_batch_matches_per_instance_solves(self):
+        lines = instance_lines(eight_starts(8), EIGHT_GOAL) + instance_lines(eight_starts(4, 1), tuple(range(9)))
+        lines.append('not an instance')
+        serial = list(puzzle_batch.solve_stream(lines, 'eight', 'table'))
+        grouped = list(puzzle_batch.solve_stream_grouped(lines, 'eight'))
+        self.assertEqual([result.get('length') for result in grouped],
+                         [result.get('length') for result in serial])
+        self.assertIn('error', grouped[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()